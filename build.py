@@ -5,9 +5,9 @@ Checks python version and builds stado source if version is correct.
 
 import sys
 
-# Check if python version >= 3.2
-if sys.hexversion < 0x030200F0:
-    sys.stdout.write("Failed to build: stado require python version >= 3.2\n")
+# Check if python version >= 3.6
+if sys.hexversion < 0x030600F0:
+    sys.stdout.write("Failed to build: stado require python version >= 3.6\n")
     sys.stdout.flush()
     sys.exit(1)
 
@@ -2,10 +2,14 @@ import tempfile
 import shutil
 import time
 import os
+import tracemalloc
 
 from stado import log
 from stado import Stado
 from stado.core.cache import ShelveCache
+from stado.core.events import EventsHandler
+from stado.core.loaders import FileItem, CompactFileItem
+from stado.templates.mustache import Mustache
 
 
 log.setLevel('INFO')
@@ -19,21 +23,69 @@ def test_cache(number=50, path='examples/basic'):
     print('Testing cache with {} sites x '
           '{} files per site = {} files.'.format(number, files, number*files))
 
-    t = time.clock()
+    t = time.perf_counter()
     app = Stado(path, output=temp_path)
     for i in range(number):
         app.run()
 
-    print('- DictCache: \t{} s.'.format(round(time.clock() - t, 3)))
+    print('- DictCache: \t{} s.'.format(round(time.perf_counter() - t, 3)))
 
-    t = time.clock()
+    t = time.perf_counter()
     app = Stado(path, output=temp_path, cache=ShelveCache)
     for i in range(number):
         app.run()
 
-    print('- ShelveCache: \t{} s.'.format(round(time.clock() - t, 3)))
+    print('- ShelveCache: \t{} s.'.format(round(time.perf_counter() - t, 3)))
+
+
+def test_items_memory(number=100000):
+
+    print('Testing memory used by {} items.'.format(number))
+
+    # FileItem uses own events handler, CompactFileItem uses shared one.
+    for item_class, events in ((FileItem, None),
+                               (CompactFileItem, EventsHandler())):
+        tracemalloc.start()
+        items = []
+        for i in range(number):
+            path = 'pages/{}.html'.format(i)
+            item = item_class(path, path)
+            item['title'] = path
+            if events is not None:
+                item.events = events
+            items.append(item)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print('- {}: \t{} MB.'.format(item_class.__name__,
+                                      round(size / 1024 / 1024, 1)))
+
+
+def test_mustache(number=10000):
+
+    print('Testing mustache with {} pages.'.format(number))
+
+    engine = Mustache()
+    compiled = Mustache()
+    compiled.compiled = True
+    template = '<h1>{{title}}</h1>{{#items}}<p>{{name}}</p>{{/items}}{{menu}}'
+    items = [{'name': i} for i in range(10)]
+    menu = {'menu': lambda: '<nav></nav>'}
+
+    for name, engine, helpers in (('without helpers', engine, {}),
+                                  ('with helpers', engine, menu),
+                                  ('compiled', compiled, menu)):
+        t = time.perf_counter()
+        for i in range(number):
+            context = {'title': i, 'items': items}
+            context.update(helpers)
+            engine.render(template, context)
+
+        print('- {}: \t{} s.'.format(name, round(time.perf_counter() - t, 3)))
 
 
 test_cache()
+test_items_memory()
+test_mustache()
 
 shutil.rmtree(temp_path)
@@ -1,8 +1,28 @@
 # Building.
 build_dir = 'output'
+# Directory in site path used to store data between builds.
+cache_dir = '.stado-cache'
 # Global output path, overrides local site path and build_dir.
 # Used to build group of sites to custom path.
 output = None
+# Global number of processes used to render items, overrides site
+# render_workers. Used by "build --jobs" option.
+render_workers = None
+# Enables incremental builds for all sites. Used by "build --incremental" option.
+incremental = False
+# Item source which dependencies are shown after building. Used by
+# "build --explain" option.
+explain = None
+# If False, render cache is not used by any site. Used by "build
+# --no-render-cache" option.
+render_cache = True
+# Show building statistics. Used by "build --stats" option.
+stats = False
+# How files without rendering, for example images, are written to output:
+# 'copy', 'hardlink' or 'reflink', overrides site copy_mode. Hardlinked files
+# share content with source files, so they must not be edited in output. Used by
+# "build --copy-mode" option.
+copy_mode = None
 
 # Development server.
 host = 'localhost'
@@ -23,5 +43,7 @@ def get_default_site_config():
         # List of controllers and plugins. If None, all available are loaded.
         'controllers': None,
         'plugins': None,
+        # Extensions used by markdown renderer, for example ['toc'].
+        'markdown_extensions': [],
     }
     
@@ -20,7 +20,17 @@ class Build(Command):
     summary = "Build the site or group of sites in output directory."
     description = ""
     options = [["-o, --output", "Specify the location to deploy to. (default: '{"
-                                 "}')".format(CONFIG.build_dir)]]
+                                 "}')".format(CONFIG.build_dir)],
+               ["-j, --jobs", "Number of processes used to render pages."],
+               ["-i, --incremental", "Render and deploy only changed files."],
+               ["--explain <source>", "Show items and files used by source and "
+                                      "items using it."],
+               ["--no-render-cache", "Render all pages again, even if site is "
+                                     "using render cache."],
+               ["--stats", "Show building time, items types, cache usage and "
+                           "the slowest pages."],
+               ["--copy-mode <mode>", "Write assets using 'copy', 'hardlink' "
+                                      "or 'reflink'. (default: 'copy')"]]
 
 
     def install(self, parser):
@@ -28,40 +38,65 @@ class Build(Command):
 
         parser.add_argument('site', default=None, nargs='?')
         parser.add_argument('--output', '-o')
+        parser.add_argument('--jobs', '-j', type=int)
+        parser.add_argument('--incremental', '-i', action='store_true')
+        parser.add_argument('--explain', metavar='source')
+        parser.add_argument('--no-render-cache', dest='render_cache',
+                            action='store_false')
+        parser.add_argument('--stats', action='store_true')
+        parser.add_argument('--copy-mode', default=None,
+                            choices=['copy', 'hardlink', 'reflink'])
         parser.set_defaults(function=self.run)
 
 
-    def run(self, site=None, output=None):
+    def run(self, site=None, output=None, jobs=None, incremental=False,
+            explain=None, render_cache=True, stats=False, copy_mode=None):
         """Command-line interface will execute this method if user type 'build'
         command."""
 
+        # Number of render processes, overrides sites settings.
+        CONFIG.render_workers = jobs
+        CONFIG.incremental = incremental
+        CONFIG.explain = explain
+        CONFIG.render_cache = render_cache
+        CONFIG.stats = stats
+        CONFIG.copy_mode = copy_mode
 
-        # Build all projects.
-        if site is None:
+        try:
+            # Build all projects.
+            if site is None:
 
-            log.info('Searching sites...')
+                log.info('Searching sites...')
 
-            # List of directories in current working directory.
-            cwd = os.getcwd()
-            dirs = [i for i in os.listdir(cwd) if os.path.isdir(os.path.join(cwd, i))]
+                # List of directories in current working directory.
+                cwd = os.getcwd()
+                dirs = [i for i in os.listdir(cwd) if os.path.isdir(os.path.join(cwd, i))]
 
-            # No sites to build.
-            if not dirs:
-                log.info('Nothing to build, what about creating a new site?')
+                # No sites to build.
+                if not dirs:
+                    log.info('Nothing to build, what about creating a new site?')
 
-            for directory in dirs:
-                # Set custom output directory.
-                if output: CONFIG.output = os.path.join(output, directory)
-                self.build_site(directory)
+                for directory in dirs:
+                    # Set custom output directory.
+                    if output: CONFIG.output = os.path.join(output, directory)
+                    self.build_site(directory)
 
-        # Build only given project.
-        else:
-            # Set custom output directory.
-            CONFIG.output = output
-            self.build_site(site)
+            # Build only given project.
+            else:
+                # Set custom output directory.
+                CONFIG.output = output
+                self.build_site(site)
+
+        finally:
+            # This is default output directory.
+            CONFIG.output = None
+            CONFIG.render_workers = None
+            CONFIG.incremental = False
+            CONFIG.explain = None
+            CONFIG.render_cache = True
+            CONFIG.stats = False
+            CONFIG.copy_mode = None
 
-        # This is default output directory.
-        CONFIG.output = None
         return True
 
 
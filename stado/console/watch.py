@@ -19,7 +19,7 @@ class Watch(Command):
     usage = 'watch [site] [options]\n    watch [options]'
     summary = 'Build the site or group of sites and watch for changes.'
     description = ''
-    options = Build.options
+    options = [Build.options[0]]
 
 
     def __init__(self, command_line):
@@ -79,11 +79,12 @@ class Watch(Command):
     def watch_site(self, path, site, output=None):
         """Add site files to file monitor."""
 
-        # Exclude output directory to prevent rebuild looping.
+        # Exclude output and cache directories to prevent rebuild looping.
         if output:
             exclude = [output]
         else:
             exclude = [os.path.join(path, config.build_dir)]
+        exclude.append(os.path.join(path, config.cache_dir))
 
         self.file_monitor.watch(path, exclude, self.event_update, site, output)
 
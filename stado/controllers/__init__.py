@@ -1,3 +1,4 @@
+import inspect
 from ..core.events import Events
 
 
@@ -12,6 +13,38 @@ class Controller(Events):
         self.site = site
 
 
+def call_adapter(function, names):
+    """Returns callable which runs function with arguments it accepts. Callable
+    is called with all values named by names, for example (data, item). Values
+    are given to function positionally, as many as function has arguments.
+    Keyword-only arguments and **kwargs get values by name.
+
+    Function arguments are checked once here, not on each call.
+    """
+
+    spec = inspect.getfullargspec(function)
+
+    positional = len(spec.args)
+    if inspect.ismethod(function):
+        positional -= 1
+    if spec.varargs:
+        positional = len(names)
+
+    keywords = [i for i in names[positional:]
+                if i in spec.kwonlyargs or spec.varkw]
+
+    if keywords:
+        def call(*values):
+            kwargs = {name: value for name, value in zip(names, values)
+                      if name in keywords}
+            return function(*values[:positional], **kwargs)
+        return call
+
+    if positional == 0:
+        return lambda *values: function()
+    return lambda *values: function(*values[:positional])
+
+
 # Plugins.
 
 from . import ignore
@@ -2,8 +2,8 @@
 @after controller
 """
 
-import inspect
-from . import Controller
+from . import Controller, call_adapter
+from ..core.pathmatch import MatchIndex
 
 
 class After(Controller):
@@ -14,6 +14,9 @@ class After(Controller):
     def method(content, item):
         ...
 
+    Function can also be called with less arguments, or with keyword-only data
+    and item arguments.
+
     """
 
     name = 'after'
@@ -30,31 +33,20 @@ class After(Controller):
             'item.after_rendering': self.update_content,
         })
 
-        self.functions = []
+        self.functions = MatchIndex()
 
 
     def __call__(self, *paths):
         """Calling @after decorator."""
 
         def wrap(function):
-            self.functions.append((function, paths))
+            self.functions.add(paths, call_adapter(function, ('data', 'item')))
         return wrap
 
     def update_content(self, item):
         """Updates item content."""
 
-        for function, paths in self.functions:
-            if item.match(*paths):
-
-                # Runs function with different arguments depending on their
-                # amount.
-
-                args = len(inspect.getfullargspec(function)[0])
-                if args == 0:
-                    content = function()
-                elif args == 1:
-                    content = function(item.data)
-                elif args == 2:
-                    content = function(item.data, item)
+        for function in self.functions.get(item.source):
 
-                item.content = content
+            # Adapter runs function with arguments it accepts.
+            item.content = function(item.data, item)
@@ -9,6 +9,9 @@ class Assets(Controller):
     def __call__(self, *paths):
         """Yields asset items from given location."""
 
+        self.site.dependencies.add_query(*paths)
+
         for item in self.site.items:
             if not item.is_page() and item.match(*paths):
+                self.site.dependencies.add_item(item.source)
                 yield item
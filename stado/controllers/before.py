@@ -2,17 +2,20 @@
 @before controller
 """
 
-import inspect
-from . import Controller
+from . import Controller, call_adapter
+from ..core.pathmatch import MatchIndex
 
 
 class Before(Controller):
     """Access to item before rendering. Usage:
 
     @before('a.html', 'b.html')
-    def page(path):
+    def page(item):
         ...
 
+    Function can also be called without arguments, or with keyword-only item
+    argument.
+
     """
 
     name = 'before'
@@ -31,31 +34,23 @@ class Before(Controller):
             'item.after_loading': self.update_metadata,
         })
 
-        self.functions = []
+        self.functions = MatchIndex()
 
 
     def __call__(self, *paths):
         """Calling @before decorator."""
 
         def wrap(function):
-            self.functions.append((function, paths))
+            self.functions.add(paths, call_adapter(function, ('item',)))
         return wrap
 
 
     def update_metadata(self, item):
         """Updates item metadata."""
 
-        for function, paths in self.functions:
-            if item.match(*paths):
-
-                # Runs function with different arguments depending on their
-                # amount.
-
-                args = inspect.getfullargspec(function)[0]
-                if len(args) == 0:
-                    metadata = function()
-                else:
-                    metadata = function(item)
+        for function in self.functions.get(item.source):
 
-                if metadata:
-                    item.metadata.update(metadata)
+            # Adapter runs function with arguments it accepts.
+            metadata = function(item)
+            if metadata:
+                item.metadata.update(metadata)
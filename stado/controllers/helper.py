@@ -10,13 +10,6 @@ class Helper(Controller):
     def __init__(self, site):
         Controller.__init__(self, site)
 
-
-        # Bind events to plugin methods.
-        self.events.bind({
-            'renderer.before_rendering': self.add_helpers,
-            'renderer.after_rendering': self.remove_helpers
-        })
-
         # Available helper methods gather from site.py file.
         self.functions = {}
 
@@ -24,6 +17,14 @@ class Helper(Controller):
     def __call__(self, function):
         """Decorator @helper. Stores function which is decorated by @helper."""
 
+        # Events are bound only when first helper is available. Items without
+        # renderers events can be rendered in other processes.
+        if not self.functions:
+            self.events.bind({
+                'renderer.before_rendering': self.add_helpers,
+                'renderer.after_rendering': self.remove_helpers
+            })
+
         # Stores function as a property.
         self.functions[function.__name__] = function
         return function
@@ -1,5 +1,6 @@
 import os
 from . import Controller
+from ..core.pathmatch import MatchIndex
 
 
 class Layout(Controller):
@@ -18,8 +19,8 @@ class Layout(Controller):
             'item.after_rendering': self.render,
         })
 
-        # Key is path to file, value is path to layout.
-        self.paths = {}
+        # Layouts registered with paths to files.
+        self.paths = MatchIndex()
 
         self.default = None
 
@@ -45,7 +46,7 @@ class Layout(Controller):
             path = target if isinstance(target, str) else target.source
 
             # 'a.html': ['layout.html'], {'context': 'variables'}
-            self.paths[path] = layout_data
+            self.paths.set([path], layout_data)
 
             # Prevents layouts files in output.
             for i in layouts:
@@ -55,12 +56,8 @@ class Layout(Controller):
     def add_layouts_property(self, item):
         """Adds layout property to each item."""
 
-        item.layouts = None
-
-        for path, layout in self.paths.items():
-            if item.match(path):
-                item.layouts = layout
-                break
+        layouts = self.paths.get(item.source)
+        item.layouts = layouts[0] if layouts else None
 
         if not item.layouts and self.default:
             item.layouts = self.default
@@ -78,14 +75,15 @@ class Layout(Controller):
             template = item.content
 
             for layout_path in layouts:
-                with open(os.path.join(self.site.path, layout_path)) as layout:
+                self.site.dependencies.add_file(layout_path)
 
-                    context = {
-                        'page': item.metadata,
-                        'content': template
-                    }
-                    context.update(layout_metadata)
+                context = {
+                    'page': item.metadata,
+                    'content': template
+                }
+                context.update(layout_metadata)
 
-                    template = self.site.template_engine.render(layout.read(), context)
+                template = self.site.template_engine.render_file(
+                    os.path.join(self.site.path, layout_path), context)
 
             item.content = template
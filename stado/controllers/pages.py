@@ -9,6 +9,9 @@ class Pages(Controller):
     def __call__(self, *paths):
         """Yields page items from given location."""
 
+        self.site.dependencies.add_query(*paths)
+
         for item in self.site.items:
             if item.is_page() and item.match(*paths):
+                self.site.dependencies.add_item(item.source)
                 yield item
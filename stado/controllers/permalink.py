@@ -1,4 +1,4 @@
-from ..core.pathmatch import pathmatch
+from ..core.pathmatch import matcher, MatchIndex
 from . import Controller
 
 
@@ -16,8 +16,8 @@ class Permalink(Controller):
             'item.after_loading': self.update_permalink,
         })
 
-        self.urls = {}
-        self.sources = []
+        # Urls registered with sources patterns.
+        self.urls = MatchIndex()
 
         self.targets = []
 
@@ -31,8 +31,7 @@ class Permalink(Controller):
         # used this argument as a permalink.
         if url is None:
             url = self.convert_style(target)
-            self.sources.append('**.html')
-            self.urls['**.html'] = url
+            self.urls.add(['**.html'], url)
 
             for item in self.site.items:
                 if item.is_page():
@@ -42,11 +41,11 @@ class Permalink(Controller):
         # Second is calling with two argument and first is item source. Find this
         # item and modify it permalink.
         if isinstance(target, str):
-            self.sources.append(target)
-            self.urls[target] = url
+            self.urls.add([target], url)
 
+            target = matcher(target)
             for source in self.site.sources:
-                if pathmatch(source, target):
+                if target.match(source):
                     item = self.site.load_item(source)
                     item.url = url
                     self.site.save_item(item)
@@ -68,6 +67,8 @@ class Permalink(Controller):
 
 
     def update_permalink(self, item):
-        for source in self.sources:
-            if item.match(source):
-                item.url = self.convert_style(self.urls[source])
+
+        # The last registered url is used.
+        urls = self.urls.get(item.source)
+        if urls:
+            item.url = self.convert_style(urls[-1])
@@ -17,7 +17,6 @@ class RenderFile(Controller):
 
         if context is None: context = {}
 
+        self.site.dependencies.add_file(path)
         path = os.path.join(self.site.path, path)
-
-        with open(path) as file:
-            return self.site.template_engine.render(file.read(), context)
+        return self.site.template_engine.render_file(path, context)
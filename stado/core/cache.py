@@ -1,8 +1,19 @@
 import os
+import sys
+import json
+import hashlib
+import importlib
 import shutil
 import shelve
+import sqlite3
+import pickle
+import threading
 import time
-from .. import log
+import pathlib
+from collections import OrderedDict
+from .. import log, version
+from .item import renderer_key
+from .manifest import replace_items
 
 
 class ItemCache:
@@ -15,6 +26,9 @@ class ItemCache:
         self.items = {}
         self.cache = cache
 
+        self.stats = {}
+        self.reset_stats()
+
     @property
     def sources(self):
         """Sources of stored items."""
@@ -22,6 +36,13 @@ class ItemCache:
             if item.enabled:
                 yield item.source
 
+    @property
+    def outputs(self):
+        """Output paths of stored items."""
+        for item in self.items.values():
+            if item.enabled:
+                yield item.output
+
     def __iter__(self):
         for item in self.items.values():
             if item.enabled:
@@ -33,22 +54,32 @@ class ItemCache:
         # Store item object.
         self.items[item.source] = item
 
-        # Store item data and metadata in cache.
-        if item.has_data():
-            self.cache.save(item.source, item.data)
-        self.cache.save(item.source + '/metadata', item.metadata.dump())
+        # Store item data and metadata in cache using one key. Items without
+        # data are reading it from source file.
+        data = item.data if item.has_data() else None
+        value = (data, item.metadata.dump())
+        self.cache.save(item.source, value)
+        self.stats['bytes_written'] += data_size(data)
 
         # Clear data and metadata to free memory.
         item.data = None
-        item.metadata.clear()
+        item.metadata = None
 
     def load_item(self, item_source):
         """Returns item from cache."""
 
         item = self.items[item_source]
         if item.enabled:
-            item.data = self.cache.load(item.source)
-            item.metadata = self.cache.load(item.source + '/metadata')
+            value = self.cache.load(item.source)
+
+            if value is None:
+                self.stats['misses'] += 1
+                value = (None, None)
+            else:
+                self.stats['hits'] += 1
+                self.stats['bytes_read'] += data_size(value[0])
+
+            item.data, item.metadata = value
             return item
         raise KeyError('Item is disabled: ' + item_source)
 
@@ -56,7 +87,28 @@ class ItemCache:
 
         item = self.items[item_source]
         self.cache.remove(item.source)
-        self.cache.remove(item.source + '/metadata')
+
+    def reset_stats(self):
+        """Sets cache usage counters to zero."""
+
+        self.stats = {'hits': 0, 'misses': 0, 'bytes_read': 0, 'bytes_written': 0}
+
+    def get_stats(self):
+        """Returns dict with cache usage counters, including statistics of
+        cache class."""
+
+        stats = dict(self.stats)
+        for key, value in getattr(self.cache, 'stats', {}).items():
+            stats['backend_' + key] = value
+        return stats
+
+    def flush(self):
+        """Writes values waiting in cache class, for example after each site
+        building step."""
+
+        flush = getattr(self.cache, 'flush', None)
+        if flush is not None:
+            flush()
 
     def clear(self):
         """Removes all elements from cache."""
@@ -65,12 +117,78 @@ class ItemCache:
 
 
 
+class Compressor:
+    """
+    Converts values to pickled bytes, which are compressed using zlib or lzma
+    module if they are bigger than threshold. Sizes of values are counted in
+    stats dict.
+    """
+
+    methods = ('zlib', 'lzma')
+
+    def __init__(self, method='zlib', threshold=1024):
+
+        if method not in self.methods:
+            raise ValueError('Unknown compression method: {}'.format(method))
+
+        self.module = importlib.import_module(method)
+        self.threshold = threshold
+
+        # Bytes before and after compressing.
+        self.stats = {'compressed': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+
+    @property
+    def ratio(self):
+        """Returns how many times stored values are smaller than pickled."""
+
+        if not self.stats['stored_bytes']:
+            return 1.0
+        return self.stats['raw_bytes'] / self.stats['stored_bytes']
+
+    def compress(self, value):
+        """Returns value as bytes. First byte marks compressed values."""
+
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        self.stats['raw_bytes'] += len(data)
+
+        if len(data) >= self.threshold:
+            data = b'\x01' + self.module.compress(data)
+            self.stats['compressed'] += 1
+        else:
+            data = b'\x00' + data
+
+        self.stats['stored_bytes'] += len(data)
+        return data
+
+    def decompress(self, data):
+        """Returns value from bytes created by compress()."""
+
+        if data[:1] == b'\x01':
+            return pickle.loads(self.module.decompress(data[1:]))
+        return pickle.loads(data[1:])
+
+
+
 class ShelveCache:
     """
-    Cache data in filesystem using shelve module.
+    Cache data in filesystem using shelve module. Shelve file is opened once for
+    the whole build. Saved and removed keys are waiting in memory and they are
+    written together by flush(), or when there are more than batch_size of them.
     """
 
-    def __init__(self, path):
+    # Marks removed key in waiting values.
+    removed = object()
+
+    def __init__(self, path, batch_size=500, compression=None, threshold=1024):
+        """
+        Arguments:
+            path: Cache is stored in __cache__ directory in this location.
+            batch_size: Maximum number of values waiting for writing.
+            compression: None, 'zlib' or 'lzma'. Values bigger than threshold
+                bytes are compressed.
+        """
+
+        self.compressor = Compressor(compression, threshold) if compression else None
 
         path = os.path.join(path, '__cache__')
 
@@ -80,44 +198,89 @@ class ShelveCache:
         os.makedirs(path)
 
         self.path = os.path.join(path, 'contents')
+        self.batch_size = batch_size
+
+        # Opened shelve object, or None if closed.
+        self.data = None
+        # Key is waiting key, value is waiting value or self.removed.
+        self.waiting = {}
 
-        # Removes previous data.
-        self.data = shelve.open(self.path)
-        self.data.clear()
-        self.data.close()
 
+    @property
+    def stats(self):
+        """Returns dict with compression statistics."""
+        return compression_stats(self.compressor)
+
+    def open(self):
+        """Returns opened shelve object."""
+
+        if self.data is None:
+
+            # If cache was cleared all cache files are removed, so recreate them.
+            cache_path = os.path.split(self.path)[0]
+            if not os.path.exists(cache_path):
+                os.makedirs(cache_path)
+
+            self.data = shelve.open(self.path)
+        return self.data
 
     def save(self, key, value):
         """Saves value in given key."""
 
-        # If cache was cleared all cache files are removed, so recreate them.
-        cache_path = os.path.split(self.path)[0]
-        if not os.path.exists(cache_path):
-            os.makedirs(cache_path)
-
-        self.data = shelve.open(self.path)
-        self.data[key] = value
-        self.data.close()
+        self.waiting[key] = value
+        if len(self.waiting) >= self.batch_size:
+            self.flush()
 
     def load(self, key):
         """Loads value from given key."""
 
-        self.data = shelve.open(self.path)
-        data = self.data.get(key)
-        self.data.close()
-        return data
+        if key in self.waiting:
+            value = self.waiting[key]
+            return None if value is self.removed else value
+
+        value = self.open().get(key)
+        if value is not None and self.compressor is not None:
+            return self.compressor.decompress(value)
+        return value
 
     def remove(self, key):
         """Remove given key."""
+        self.waiting[key] = self.removed
 
-        self.data = shelve.open(self.path)
-        if key in self.data:
-            del self.data[key]
-        self.data.close()
+    def flush(self):
+        """Writes waiting values to shelve file."""
+
+        if not self.waiting:
+            return
+
+        data = self.open()
+        for key, value in self.waiting.items():
+            if value is not self.removed:
+                if self.compressor is not None:
+                    value = self.compressor.compress(value)
+                data[key] = value
+            elif key in data:
+                del data[key]
+
+        data.sync()
+        self.waiting.clear()
+
+    def close(self):
+        """Writes waiting values and closes shelve file."""
+
+        self.flush()
+        if self.data is not None:
+            self.data.close()
+            self.data = None
 
     def clear(self):
         """Removes cache files."""
 
+        self.waiting.clear()
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+
         cache_path = os.path.split(self.path)[0]
 
         for file in os.listdir(cache_path):
@@ -132,6 +295,345 @@ class ShelveCache:
         os.rmdir(cache_path)
 
 
+class SQLiteCache:
+    """
+    Cache data in single SQLite database file. Database uses write-ahead log, so
+    it can be read by other processes, for example render workers or development
+    server, while site is built. Changes are committed together by flush(), which
+    is run after each site building step.
+    """
+
+    filename = 'contents.sqlite'
+
+    def __init__(self, path, readonly=False, compression=None, threshold=1024):
+        """
+        Arguments:
+            path: Cache is stored in __cache__ directory in this location.
+            readonly: If True, existing cache is opened only for reading, for
+                example by other process.
+            compression: None, 'zlib' or 'lzma'. Values bigger than threshold
+                bytes are compressed. Readers must use the same compression.
+        """
+
+        self.compressor = Compressor(compression, threshold) if compression else None
+
+        path = os.path.join(path, '__cache__')
+        self.path = os.path.join(path, self.filename)
+        self.readonly = readonly
+
+        # Removes old cache.
+        if not readonly:
+            if os.path.exists(path):
+                shutil.rmtree(path)
+            os.makedirs(path)
+
+        # Connection is shared by threads, so use it only with lock.
+        self.connection = None
+        self.lock = threading.Lock()
+
+
+    @property
+    def stats(self):
+        """Returns dict with compression statistics."""
+        return compression_stats(self.compressor)
+
+    def open(self):
+        """Returns opened database connection."""
+
+        if self.connection is not None:
+            return self.connection
+
+        if self.readonly:
+            # Characters like '?' or '#' in path must be escaped in uri.
+            uri = pathlib.Path(os.path.abspath(self.path)).as_uri() + '?mode=ro'
+            self.connection = sqlite3.connect(uri, uri=True,
+                                              check_same_thread=False)
+            return self.connection
+
+        # If cache was cleared all cache files are removed, so recreate them.
+        cache_path = os.path.split(self.path)[0]
+        if not os.path.exists(cache_path):
+            os.makedirs(cache_path)
+
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('CREATE TABLE IF NOT EXISTS cache '
+                           '(key TEXT PRIMARY KEY, value BLOB)')
+        connection.commit()
+
+        self.connection = connection
+        return connection
+
+    def save(self, key, value):
+        """Saves value in given key."""
+
+        if self.compressor is not None:
+            value = self.compressor.compress(value)
+        else:
+            value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+        with self.lock:
+            self.open().execute('INSERT OR REPLACE INTO cache VALUES (?, ?)',
+                                (key, value))
+
+    def load(self, key):
+        """Loads value from given key."""
+
+        with self.lock:
+            row = self.open().execute('SELECT value FROM cache WHERE key = ?',
+                                      (key,)).fetchone()
+
+        if row is None:
+            return None
+        if self.compressor is not None:
+            return self.compressor.decompress(row[0])
+        return pickle.loads(row[0])
+
+    def remove(self, key):
+        """Remove given key."""
+
+        with self.lock:
+            self.open().execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def flush(self):
+        """Commits saved and removed keys."""
+
+        with self.lock:
+            if self.connection is not None:
+                self.connection.commit()
+
+    def close(self):
+        """Commits changes and closes database connection."""
+
+        self.flush()
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def clear(self):
+        """Removes cache files. Readonly cache only closes connection, because
+        files belong to other cache object."""
+
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+        if self.readonly:
+            return
+
+        cache_path = os.path.split(self.path)[0]
+        if os.path.exists(cache_path):
+            shutil.rmtree(cache_path)
+
+
+class TieredCache:
+    """
+    Keeps recently used values in memory, but only up to max_size bytes. Least
+    recently used values are moved to disk cache, for example ShelveCache. Disk
+    cache is created only when first value does not fit in memory, so small sites
+    are stored only in memory.
+    """
+
+    def __init__(self, path, max_size=128 * 1024 * 1024, disk_cache=ShelveCache):
+        """
+        Arguments:
+            path: Location used to create disk cache.
+            max_size: Maximum size in bytes of values stored in memory.
+            disk_cache: Cache class used to store values removed from memory.
+        """
+
+        self.path = path
+        self.max_size = max_size
+        self.disk_cache = disk_cache
+        self.disk = None
+
+        # Key is cache key, value is (value, size) tuple. Last is newest.
+        self.memory = OrderedDict()
+        self.size = 0
+
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+    def save(self, key, value):
+        """Saves value in given key."""
+
+        if key in self.memory:
+            self.size -= self.memory.pop(key)[1]
+
+        size = sizeof(value)
+        self.memory[key] = (value, size)
+        self.size += size
+
+        # Move least recently used values to disk.
+        while self.size > self.max_size and self.memory:
+            old_key, (old_value, old_size) = self.memory.popitem(last=False)
+            self.size -= old_size
+
+            if self.disk is None:
+                self.disk = self.disk_cache(self.path)
+            self.disk.save(old_key, old_value)
+            self.stats['evictions'] += 1
+
+    def load(self, key):
+        """Loads value from given key. Value loaded from disk is moved back to
+        memory."""
+
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.stats['hits'] += 1
+            return self.memory[key][0]
+
+        self.stats['misses'] += 1
+        if self.disk is None:
+            return None
+
+        value = self.disk.load(key)
+        if value is not None:
+            self.save(key, value)
+        return value
+
+    def remove(self, key):
+        """Remove given key."""
+
+        if key in self.memory:
+            self.size -= self.memory.pop(key)[1]
+        if self.disk is not None:
+            self.disk.remove(key)
+
+    def flush(self):
+        """Writes values waiting in disk cache."""
+
+        if self.disk is not None and hasattr(self.disk, 'flush'):
+            self.disk.flush()
+
+    def clear(self):
+        """Removes values from memory and disk cache files."""
+
+        self.memory.clear()
+        self.size = 0
+
+        if self.disk is not None:
+            self.disk.clear()
+            self.disk = None
+
+
+class RenderCache:
+    """
+    Stores rendered item data between builds. Key is hash of item data, metadata,
+    renderers names and stado version. Least recently used files are removed when
+    cache is bigger than max_size bytes.
+
+    Items rendered by renderers which read other files, for example templates
+    with partials, are not cached. Renderer shows it using optional
+    loads_files(data) method.
+    """
+
+    def __init__(self, path, max_size=256 * 1024 * 1024):
+
+        self.path = path
+        self.max_size = max_size
+
+        self.stats = {'hits': 0, 'misses': 0}
+
+
+    def key(self, item):
+        """Returns cache key of given item, or None if item can not be cached,
+        for example when its metadata can not be serialized to json."""
+
+        # Helpers are changing metadata during rendering.
+        if not item.renderers or item.has_renderer_events():
+            return None
+
+        data = item.data
+        for renderer in item.renderers:
+            loads_files = getattr(renderer, 'loads_files', None)
+            if loads_files is not None and (not isinstance(data, str) or
+                                            loads_files(data)):
+                return None
+
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        elif not isinstance(data, bytes):
+            return None
+
+        # Items in metadata are represented by their source and metadata,
+        # without items nested in them.
+        try:
+            metadata = json.dumps(replace_items(item.metadata.dump(), True),
+                                  sort_keys=True)
+        except (TypeError, ValueError, RecursionError):
+            return None
+
+        checksum = hashlib.sha1(data)
+        checksum.update(metadata.encode('utf-8'))
+        for i in [version] + [renderer_key(i) for i in item.renderers]:
+            checksum.update(b'\0' + i.encode('utf-8'))
+        return checksum.hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def load(self, key):
+        """Returns rendered data stored in given key, or None."""
+
+        path = self._file(key)
+        try:
+            with open(path, mode='rb') as file:
+                value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.stats['misses'] += 1
+            return None
+
+        # Modification time is used to find least recently used files.
+        os.utime(path, None)
+        self.stats['hits'] += 1
+        return value
+
+    def save(self, key, value):
+        """Saves rendered data in given key."""
+
+        path = self._file(key)
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(path, mode='wb') as file:
+            pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+
+    def prune(self):
+        """Removes least recently used files until cache is not bigger than
+        max_size. Returns number of removed files."""
+
+        if not os.path.exists(self.path):
+            return 0
+
+        files = []
+        size = 0
+        for path, dirs, names in os.walk(self.path):
+            for name in names:
+                stat = os.stat(os.path.join(path, name))
+                files.append((stat.st_mtime, stat.st_size, os.path.join(path, name)))
+                size += stat.st_size
+
+        removed = 0
+        for mtime, file_size, path in sorted(files):
+            if size <= self.max_size:
+                break
+            os.remove(path)
+            size -= file_size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Removes all cache files."""
+
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path)
+
+
 class DictCache:
     """
     Cache data in filesystem using shelve module.
@@ -157,6 +659,46 @@ class DictCache:
         if key in self.data:
             del self.data[key]
 
+    def flush(self):
+        """Values are stored in memory, so there is nothing to write."""
+        pass
+
     def clear(self):
         """Removes cache files."""
         self.data.clear()
+
+
+
+def data_size(data):
+    """Returns length of str or bytes item data, other data is not measured."""
+
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        return len(data)
+    return 0
+
+
+def sizeof(value):
+    """Returns estimate of value size in bytes. Item cache values are (data,
+    metadata) tuples, size of metadata is length of its json with items
+    replaced by their source."""
+
+    if isinstance(value, tuple):
+        return sum(sizeof(i) for i in value)
+    if isinstance(value, (str, bytes, bytearray, memoryview)):
+        return len(value)
+
+    try:
+        return len(json.dumps(replace_items(value), default=repr))
+    except (TypeError, ValueError, RecursionError):
+        return sys.getsizeof(value)
+
+
+def compression_stats(compressor):
+    """Returns dict with Compressor statistics and compression ratio."""
+
+    if compressor is None:
+        return {}
+
+    stats = dict(compressor.stats)
+    stats['ratio'] = round(compressor.ratio, 2)
+    return stats
@@ -0,0 +1,112 @@
+"""
+Dependencies between items. Controllers record here which items, files and
+queries were used while other item was built.
+"""
+
+from contextlib import contextmanager
+from .pathmatch import pathmatch
+
+
+class DependencyGraph:
+    """
+    Key is item source, value is dict with sets of read item sources, files
+    (relative to site path) and queries patterns. Use building() to set item
+    which is currently built.
+    """
+
+    def __init__(self):
+
+        self.dependencies = {}
+        # Sources of items which are currently built, last is the newest.
+        self.stack = []
+
+
+    @contextmanager
+    def building(self, source):
+        """Dependencies recorded inside with statement are added to item with
+        given source."""
+
+        self.stack.append(source)
+        try:
+            yield
+        finally:
+            self.stack.pop()
+
+    def _current(self):
+        """Returns dependencies of currently built item or None."""
+
+        if not self.stack:
+            return None
+
+        source = self.stack[-1]
+        if source not in self.dependencies:
+            self.dependencies[source] = {'items': set(), 'files': set(),
+                                         'queries': set()}
+        return self.dependencies[source]
+
+
+    # Recording.
+
+    def add_item(self, source):
+        """Currently built item reads item with given source."""
+
+        current = self._current()
+        if current is not None and source != self.stack[-1]:
+            current['items'].add(source)
+
+    def add_file(self, path):
+        """Currently built item reads file, path is relative to site path."""
+
+        current = self._current()
+        if current is not None:
+            current['files'].add(path.replace('\\', '/'))
+
+    def add_query(self, *patterns):
+        """Currently built item searches items matching given patterns."""
+
+        current = self._current()
+        if current is not None:
+            current['queries'].update(patterns)
+
+
+    # Reading.
+
+    def get(self, source):
+        """Returns dict with sorted lists of item dependencies."""
+
+        dependencies = self.dependencies.get(source, {})
+        return {key: sorted(dependencies.get(key, ()))
+                for key in ('items', 'files', 'queries')}
+
+    def dependents(self, source):
+        """Returns sorted list of items which read item or file with given
+        source."""
+
+        result = []
+        for item, dependencies in self.dependencies.items():
+            if (source in dependencies['items'] or
+                    source in dependencies['files'] or
+                    pathmatch(source, *dependencies['queries'])):
+                result.append(item)
+        return sorted(result)
+
+    def explain(self, source):
+        """Returns message with dependencies and dependents of given source."""
+
+        lines = [source, '  depends on:']
+
+        dependencies = self.get(source)
+        for key, label in (('items', 'item'), ('files', 'file'),
+                           ('queries', 'query')):
+            for i in dependencies[key]:
+                lines.append('    {}: {}'.format(label, i))
+
+        lines.append('  required by:')
+        for i in self.dependents(source):
+            lines.append('    item: {}'.format(i))
+
+        return '\n'.join(lines)
+
+    def clear(self):
+        self.dependencies.clear()
+        self.stack = []
@@ -1,5 +1,10 @@
 # Events.
 
+# Incremented each time any handler binds events or subscribes object, so
+# dispatch tables of all handlers are created again.
+generation = 0
+
+
 class EventsHandler:
     """Basic events system. How  it works:
 
@@ -8,6 +13,8 @@ class EventsHandler:
       subscribe()
     - Object send event using notify() method.
 
+    Methods bound to each event by subscribers are stored in dispatch table, so
+    sending event runs only these methods.
     """
 
     def __init__(self):
@@ -17,6 +24,11 @@ class EventsHandler:
         # Key is event name, value is method to run when event is triggered.
         self.registered = {}
 
+        # Dispatch table, key is event name, value is list of subscribers
+        # methods in subscribers order.
+        self.table = {}
+        self.generation = generation
+
     def subscribe(self, obj):
 
         if not isinstance(obj.events, EventsHandler):
@@ -25,20 +37,50 @@ class EventsHandler:
         if not obj in self.subscribers:
             self.subscribers.append(obj)
             self.subscribers.sort(key=lambda x: getattr(x, 'order', 10))
+            changed()
+
+
+    def handlers(self, event):
+        """Returns list of subscribers methods bound to given event."""
+
+        if self.generation != generation:
+            self.table = {}
+            self.generation = generation
 
+        try:
+            return self.table[event]
+        except KeyError:
+            handlers = [obj.events.registered[event] for obj in self.subscribers
+                        if event in obj.events.registered]
+            self.table[event] = handlers
+            return handlers
 
     def notify(self, event, *args, **kwargs):
-        for obj in self.subscribers:
-            if event in obj.events.registered:
-                yield obj.events.registered[event](*args, **kwargs)
+        for handler in self.handlers(event):
+            yield handler(*args, **kwargs)
 
     def bind(self, events):
         self.registered.update(events)
+        changed()
+
+    def has(self, event):
+        """Returns True if any subscriber is bound to given event."""
+        return bool(self.handlers(event))
+
+
+def changed():
+    """Invalidates dispatch tables of all events handlers."""
+
+    global generation
+    generation += 1
 
 
 class Events:
     """Class should inherit this to use events system."""
 
+    # Allows subclasses using __slots__.
+    __slots__ = ()
+
     def __init__(self):
         self.events = EventsHandler()
 
@@ -4,8 +4,10 @@ to create Content objects.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from .events import Events
-from .pathmatch import pathmatch
+from .pathmatch import matcher
 
 
 
@@ -30,32 +32,110 @@ class FileSystemItemFinder(ItemFinder):
         path directory.
         """
 
+        for file_path, stat in self.scan(path, excluded_paths):
+            yield file_path
+
+    def scan(self, path, excluded_paths=None):
+        """Like search(), but yields (path, os.stat_result) pairs. Files in each
+        directory are sorted by name and yielded before its subdirectories.
+        Excluded directories are not scanned.
+        """
+
+        excluded = self.excluded(path, excluded_paths)
+
+        directories = [path]
+        while directories:
+            files, folders = self.scan_directory(directories.pop(), *excluded)
+            yield from files
+
+            # Folders are popped from the end, so the first is scanned first.
+            directories.extend(reversed(folders))
+
+    def excluded(self, path, excluded_paths=None):
+        """Returns PathMatcher objects matching excluded names and paths."""
+
         # Add path to excluded paths. It will be easier to match them.
         if excluded_paths is None: excluded_paths = []
         excluded_paths = [os.path.join(path, e) for e in excluded_paths]
+        return matcher(*self.excluded_names), matcher(*excluded_paths)
+
+    @staticmethod
+    def scan_directory(dirpath, excluded_names, excluded_paths):
+        """Returns list of (path, stat) pairs of files in directory and list of
+        paths to its subdirectories, both sorted by name. Like os.walk(),
+        directories which can not be read are skipped. Stat is None if file can
+        not be read, for example broken link."""
+
+        try:
+            with os.scandir(dirpath) as entries:
+                entries = sorted(entries, key=lambda x: x.name)
+        except OSError:
+            return [], []
+
+        files = []
+        folders = []
+        for entry in entries:
+            entry_path = os.path.join(dirpath, entry.name)
+
+            # Skip excluded files and folders.
+            if (excluded_names.match(entry.name) or
+                    excluded_paths.match(entry_path)):
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Like os.walk(), links to directories are not followed.
+                if not entry.is_symlink():
+                    folders.append(entry_path)
+            else:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    stat = None
+                files.append((entry_path, stat))
+
+        return files, folders
 
-        for dirpath, folders, files in os.walk(path):
 
-            # Skip excluded folders.
-            for folder in folders:
-                if self.is_excluded(folder) or pathmatch(os.path.join(dirpath,
-                                                         folder), *excluded_paths):
-                    folders.remove(folder)
+    def is_excluded(self, name):
+        """Returns True if given name should be excluded."""
 
+        if matcher(*self.excluded_names).match(name):
+            return True
 
-            for file in files:
-                file_path = os.path.join(dirpath, file)
 
-                # Skip excluded files.
-                if self.is_excluded(file) or pathmatch(file_path, *excluded_paths):
-                    continue
 
-                yield file_path
+class ParallelFileSystemItemFinder(FileSystemItemFinder):
+    """
+    Scans directories concurrently using pool of threads, useful when file
+    system is slow, for example network one. Paths are yielded in the same order
+    as FileSystemItemFinder yields them.
+    """
 
+    def __init__(self, workers=8):
+        self.workers = workers
 
-    def is_excluded(self, name):
-        """Returns True if given name should be excluded."""
+    def scan(self, path, excluded_paths=None):
+
+        excluded = self.excluded(path, excluded_paths)
+
+        with ThreadPoolExecutor(self.workers) as pool:
+
+            def scan_directory(dirpath):
+                """Scans directory and starts scanning its subdirectories, so
+                they are scanned before previous files are yielded."""
+
+                files, folders = self.scan_directory(dirpath, *excluded)
+                return files, [pool.submit(scan_directory, i) for i in folders]
+
+            directories = [pool.submit(scan_directory, path)]
+            while directories:
+                files, folders = directories.pop().result()
+                yield from files
 
-        for pattern in self.excluded_names:
-            if pathmatch(name, pattern):
-                return True
+                # Folders are popped from the end, so the first is used first.
+                directories.extend(reversed(folders))
@@ -1,9 +1,54 @@
 import os
 import re
+import pickle
 import urllib.request
+from collections.abc import MutableMapping
+
+from .events import Events, EventsHandler
+from .pathmatch import matcher
+from ..utils import Timer
+
+
+def call_renderer(renderer, data, metadata):
+    """Returns data rendered using given renderer."""
+
+    if callable(renderer):
+        return renderer(data, metadata)
+    return renderer.render(data, metadata)
+
+
+def render_snapshot(snapshot):
+    """Returns data rendered from SiteItem.snapshot() and list of (renderer name,
+    seconds) pairs. It is used by render workers processes."""
+
+    data, metadata, renderers = pickle.loads(snapshot)
+    timings = []
+
+    for renderer in renderers:
+        timer = Timer()
+        data = call_renderer(renderer, data, dict(metadata))
+        timings.append((renderer_name(renderer), timer.elapsed))
+    return data, timings
+
+
+def renderer_name(renderer):
+    """Returns name of renderer function or renderer class."""
+
+    if not hasattr(renderer, '__qualname__'):
+        renderer = type(renderer)
+    return '{}.{}'.format(renderer.__module__, renderer.__qualname__)
+
+
+def renderer_key(renderer):
+    """Returns renderer name with its options from optional cache_key
+    attribute. Items rendered by renderers with different keys are rendered
+    again in incremental builds and when using render cache."""
+
+    key = getattr(renderer, 'cache_key', None)
+    if not key:
+        return renderer_name(renderer)
+    return '{}:{}'.format(renderer_name(renderer), key)
 
-from .events import Events
-from .pathmatch import pathmatch
 
 
 class ItemTypes:
@@ -33,37 +78,51 @@ class ItemTypes:
 
         raise KeyError('Default content type model not found!')
 
-    def set(self, extension, loaders, renderers, deployers):
+    def set(self, extension, loaders, renderers, deployers, binary=False):
 
         self.models[extension] = {
             'extension': extension,
             'loaders': loaders,
             'renderers': renderers,
             'deployers': deployers,
+            'binary': binary,
         }
 
 
 
-class SiteItem(dict, Events):
+class BaseItem(Events):
     """
-    Represents thing used to create site. For example site source files.
+    Methods shared by SiteItem and CompactItem. Subclass stores item metadata.
     """
 
-    def __init__(self, source, output, path=None):
+    __slots__ = ()
+
+    # RenderCache object set by site, stores rendered data between builds.
+    render_cache = None
+    # Site copy_mode used by CopyDeployer.
+    copy_mode = 'copy'
+
+    def __init__(self, source, output, path=None, events=None):
         """
         Args:
             source: Item is recognized by source property. For example controllers
                 use this.
             output: Path in output directory, where item will be written.
             path: Optionally full path to file which was used to create item.
+            events: Optionally EventsHandler object shared by many items.
 
         """
-        Events.__init__(self)
+
+        # EventsHandler is created when it is first used, site replaces it
+        # with handler shared by all items.
+        self._events = events
 
         # Absolute path to file which was used to create item for example: "a/b.html"
         self.path = path
         self.type = None
         self.enabled = True
+        # If True, item file is read as bytes.
+        self.binary = False
 
         # Item is recognized by controllers using this property.
         self.source = os.path.normpath(source).replace('\\', '/')
@@ -85,6 +144,15 @@ class SiteItem(dict, Events):
 
     # Properties.
 
+    @property
+    def events(self):
+        if self._events is None:
+            self._events = EventsHandler()
+        return self._events
+    @events.setter
+    def events(self, value):
+        self._events = value
+
     @property
     def content(self):
         return self.data
@@ -92,18 +160,6 @@ class SiteItem(dict, Events):
     def content(self, value):
         self.data = value
 
-    @property
-    def metadata(self):
-        """Metadata dict, for example used during content rendering."""
-        return self
-    @metadata.setter
-    def metadata(self, value):
-        self.clear()
-
-        if value is not None:
-            self.update(value)
-
-
     @property
     def url(self):
         """Item will be available using this url."""
@@ -154,10 +210,7 @@ class SiteItem(dict, Events):
     def match(self, *sources):
         """Returns True if item source matches one of given."""
 
-        for source in sources:
-            if pathmatch(self.source, source):
-                return True
-        return False
+        return matcher(*sources).match(self.source)
 
 
     def set_type(self, type):
@@ -172,17 +225,12 @@ class SiteItem(dict, Events):
         self.renderers = type['renderers']
         # Deployer object.
         self.deployer = type['deployers']
+        self.binary = type.get('binary', False)
 
         if self.deployer.url:
             self.url = self.deployer.url
 
 
-    def dump(self):
-        """Returns new dict with item metadata."""
-
-        return dict(self)
-
-
     # Loading , rendering, deploying.
 
     def load(self):
@@ -203,30 +251,195 @@ class SiteItem(dict, Events):
         return self
 
 
-    def render(self):
+    def render(self, timings=None):
         """Renders content data using each renderer. After each rendering previous
-        data is overwritten with new rendered one."""
+        data is overwritten with new rendered one. Time used by each renderer is
+        appended to optional timings list."""
 
         # Event before rendering is started.
         self.event('item.before_rendering', self)
 
+        self.run_renderers(timings)
+
+        # Event rendering has ended.
+        self.event('item.after_rendering', self)
+        return self
+
+    def run_renderers(self, timings=None):
+        """Renders content data using each renderer, without item events. Data
+        rendered in previous builds is loaded from render cache. Time used by
+        each renderer is appended to optional timings list as (renderer name,
+        seconds) pair."""
+
+        cache = self.render_cache
+        key = cache.key(self) if cache is not None else None
+
+        if key is not None:
+            data = cache.load(key)
+            if data is not None:
+                self.data = data
+                return self
+
         for renderer in self.renderers:
             self.event('renderer.before_rendering', self, renderer)
-            if callable(renderer):
-                self.data = renderer(self.data, self.metadata.dump())
-            else:
-                self.data = renderer.render(self.data, self.metadata.dump())
+
+            timer = Timer()
+            self.data = call_renderer(renderer, self.data, self.metadata.dump())
+            if timings is not None:
+                timings.append((renderer_name(renderer), timer.elapsed))
+
             self.event('renderer.after_rendering', self, renderer)
 
-        # Event rendering has ended.
-        self.event('item.after_rendering', self)
+        if key is not None:
+            cache.save(key, self.data)
         return self
 
+    def has_renderer_events(self):
+        """Returns True if controllers are using renderers events."""
+
+        return (self.events.has('renderer.before_rendering') or
+                self.events.has('renderer.after_rendering'))
+
+    def snapshot(self):
+        """Returns pickled item data, metadata and renderers, which can be
+        rendered in other process using render_snapshot(). Returns None if item
+        must be rendered in this process."""
+
+        # Renderers events are run by controllers, so they must run here.
+        if self.has_renderer_events():
+            return None
+
+        try:
+            return pickle.dumps((self.data, self.metadata.dump(), self.renderers))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+
 
     def deploy(self, path):
-        """Writes page to output directory in given path"""
+        """Writes page to output directory in given path. Returns False if
+        deployer did not change output file, because it was up to date."""
 
         self.event('item.before_deploying', self)
-        self.deployer.deploy(self, os.path.join(path, self.output))
+        written = self.deployer.deploy(self, os.path.join(path, self.output))
         self.event('item.after_deploying', self)
+        return written is not False
+
+
+
+class SiteItem(dict, BaseItem):
+    """
+    Represents thing used to create site. For example site source files. Item is
+    a dict with item metadata.
+    """
+
+    def __init__(self, source, output, path=None, events=None):
+        BaseItem.__init__(self, source, output, path, events)
+
+    @property
+    def metadata(self):
+        """Metadata dict, for example used during content rendering."""
+        return self
+    @metadata.setter
+    def metadata(self, value):
+        self.clear()
+
+        if value is not None:
+            self.update(value)
+
+    def dump(self):
+        """Returns new dict with item metadata."""
+
+        return dict(self)
+
+
+
+class CompactItem(BaseItem, MutableMapping):
+    """
+    Item using less memory than SiteItem, useful for sites with a lot of items.
+    Attributes are stored in slots, so controllers can not add other attributes.
+    Metadata dict is created when first key is set. Metadata keys are also
+    available as attributes, so templates can read them.
+    """
+
+    __slots__ = ('_events', 'path', 'type', 'enabled', 'binary', 'source', '_data',
+                 'default_output', 'output', 'filename', 'loaders', 'renderers',
+                 'deployer', 'render_cache', 'copy_mode', 'layouts', '_metadata')
+
+    def __init__(self, source, output, path=None, events=None):
+
+        self._metadata = None
+        self.render_cache = None
+        self.copy_mode = 'copy'
+        # Set by layout controller.
+        self.layouts = None
+
+        BaseItem.__init__(self, source, output, path, events)
+
+    @property
+    def data(self):
+        return self._data
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def metadata(self):
+        """Metadata of item, it is item itself like in SiteItem."""
         return self
+    @metadata.setter
+    def metadata(self, value):
+        self._metadata = dict(value) if value else None
+
+    def dump(self):
+        """Returns new dict with item metadata."""
+
+        return dict(self._metadata) if self._metadata else {}
+
+
+    # Metadata mapping.
+
+    def __getitem__(self, key):
+        if self._metadata is None:
+            raise KeyError(key)
+        return self._metadata[key]
+
+    def __setitem__(self, key, value):
+        if self._metadata is None:
+            self._metadata = {}
+        self._metadata[key] = value
+
+    def __delitem__(self, key):
+        if self._metadata is None:
+            raise KeyError(key)
+        del self._metadata[key]
+        if not self._metadata:
+            self._metadata = None
+
+    def __iter__(self):
+        return iter(self._metadata or ())
+
+    def __len__(self):
+        return len(self._metadata) if self._metadata else 0
+
+    def __contains__(self, key):
+        return self._metadata is not None and key in self._metadata
+
+    def __getattr__(self, name):
+        # Called only when attribute is not found.
+        try:
+            metadata = object.__getattribute__(self, '_metadata')
+        except AttributeError:
+            metadata = None
+        if metadata and name in metadata:
+            return metadata[name]
+        raise AttributeError(name)
+
+    def update(self, *args, **kwargs):
+        if self._metadata is None:
+            self._metadata = {}
+        self._metadata.update(*args, **kwargs)
+        if not self._metadata:
+            self._metadata = None
+
+    def clear(self):
+        self._metadata = None
@@ -1,6 +1,7 @@
 import os
+import mmap
 
-from .item import SiteItem
+from .item import SiteItem, CompactItem
 from .finders import FileSystemItemFinder
 from .events import Events
 
@@ -33,39 +34,64 @@ class FileSystemItemLoader(ItemLoader):
 
     finder = FileSystemItemFinder()
 
+    def __init__(self, item_class=None, finder=None):
+        """
+        Args:
+            item_class: Class of created items, FileItem or CompactFileItem.
+                CompactFileItem uses less memory on sites with a lot of files.
+            finder: Finder object used to search files, for example
+                ParallelFileSystemItemFinder. Default is FileSystemItemFinder.
+        """
+
+        Events.__init__(self)
+        self.item_class = FileItem if item_class is None else item_class
+        if finder is not None:
+            self.finder = finder
+
 
     def load(self, path, excluded_paths=None):
 
-        for content_path in self.finder.search(path, excluded_paths):
+        for content_path, stat in self.finder.scan(path, excluded_paths):
 
             # output: Content will be written in output directory using this path.
             #   For example: "about/index.html"
             # id: Content is recognized by controllers using it is. Id is same as
             #   source path.
             output = os.path.relpath(content_path, path)
-            yield FileItem(content_path, output)
+            yield self.item_class(content_path, output, stat)
 
 
-class FileItem(SiteItem):
 
-    def __init__(self, path, output):
+class FileData:
+    """
+    Item data is read from file when it is used first time. Binary items are
+    read as bytes, large binary files are available as memoryview of mapped
+    file.
+    """
 
-        # File item source is same as item output. For example if source path is
-        # "b.html", it be that same as a item output path: "output/b.html".
+    __slots__ = ()
 
-        SiteItem.__init__(self, source=output, output=output, path=path)
-
-        # Item type is recognized using file extension.
-        self.type = os.path.splitext(path)[1][1:]
-
-        # If item content it not set - it will be read directly from file.
-        self._data = None
+    # Binary files bigger than this size in bytes are mapped to memory.
+    mmap_threshold = 16 * 1024 * 1024
 
     @property
     def data(self):
         if self._data is None:
-            with open(self.path) as file:
-                return file.read()
+            if not self.binary:
+                with open(self.path) as file:
+                    self._data = file.read()
+            else:
+                size = self.stat.st_size if self.stat else os.path.getsize(self.path)
+
+                # Mapped file is not stored in item, it is not read again
+                # anyway and it can not be saved in cache.
+                if size > self.mmap_threshold:
+                    with open(self.path, mode='rb') as file:
+                        return memoryview(mmap.mmap(file.fileno(), 0,
+                                                    access=mmap.ACCESS_READ))
+
+                with open(self.path, mode='rb') as file:
+                    self._data = file.read()
         return self._data
 
     @data.setter
@@ -74,3 +100,35 @@ class FileItem(SiteItem):
 
     def has_data(self):
         return False if self._data is None else True
+
+
+class FileItem(FileData, SiteItem):
+
+    def __init__(self, path, output, stat=None):
+
+        # File item source is same as item output. For example if source path is
+        # "b.html", it be that same as a item output path: "output/b.html".
+
+        SiteItem.__init__(self, source=output, output=output, path=path)
+
+        # Item type is recognized using file extension.
+        self.type = os.path.splitext(path)[1][1:]
+
+        # If item content it not set - it will be read directly from file.
+        self._data = None
+
+        # Result of os.stat() from finder, reused instead of reading it again.
+        self.stat = stat
+
+
+class CompactFileItem(FileData, CompactItem):
+    """FileItem using less memory, see CompactItem."""
+
+    __slots__ = ('stat',)
+
+    def __init__(self, path, output, stat=None):
+
+        CompactItem.__init__(self, source=output, output=output, path=path)
+        self.type = os.path.splitext(path)[1][1:]
+        self._data = None
+        self.stat = stat
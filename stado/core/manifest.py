@@ -0,0 +1,262 @@
+"""
+Build manifest. Stores inputs and dependencies of each item from previous build
+in output directory, so items which were not changed are not rendered and
+deployed again.
+"""
+
+import os
+import json
+import hashlib
+
+from .. import version
+from .pathmatch import pathmatch
+from .item import BaseItem, renderer_key
+
+
+class Manifest:
+    """
+    Item inputs from previous build, key is item source. Use update() to find
+    items changed since previous build.
+    """
+
+    filename = '.stado-manifest.json'
+
+    def __init__(self, site):
+
+        self.site = site
+        self.path = os.path.join(site.output, self.filename)
+
+        # Entries from previous build.
+        self.previous = {}
+        # Key is path to file relative to site path, value is [mtime, size,
+        # hash] list. Manifest is published with output, so it does not contain
+        # absolute paths.
+        self.previous_files = {}
+
+        # Entries and files from current build.
+        self.items = {}
+        self.files = {}
+
+        # Sources of items which have to be rendered and deployed.
+        self.changed = set()
+
+        # Each item has to be rebuild after updating stado or site.py file.
+        self.key = '{}:{}'.format(version,
+                                  self.file_hash(os.path.join(site.path, 'site.py')))
+
+        self.load()
+
+
+    def load(self):
+        """Loads manifest of previous build from output directory."""
+
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+        except ValueError:
+            return
+
+        if data.get('key') == self.key:
+            self.previous = data['items']
+            self.previous_files = data['files']
+
+    def save(self):
+        """Saves manifest of current build in output directory."""
+
+        for source, entry in self.items.items():
+            entry['dependencies'] = self.dependencies(source)
+
+        if not os.path.exists(self.site.output):
+            os.makedirs(self.site.output)
+
+        with open(self.path, mode='w') as file:
+            json.dump({'key': self.key, 'items': self.items, 'files': self.files},
+                      file, sort_keys=True)
+
+
+    # Items.
+
+    def update(self, items):
+        """Stores inputs of given items. Marks items which were changed since
+        previous build, or which depend on changed items or files."""
+
+        for item in items:
+            entry = self.fingerprint(item)
+            self.items[item.source] = entry
+
+            previous = dict(self.previous.get(item.source, {}))
+            previous.pop('dependencies', None)
+            output = os.path.join(self.site.output, item.output)
+
+            # Inputs which can not be hashed are always changed.
+            if (entry != previous or None in (entry['source'], entry['metadata'])
+                    or not os.path.exists(output)):
+                self.changed.add(item.source)
+
+        self.propagate()
+
+    def propagate(self):
+        """Marks items which depend on changed items or files as changed."""
+
+        # Sources of changed, added and deleted items.
+        sources = self.changed | (set(self.items) ^ set(self.previous))
+
+        # Dependencies of not changed items from previous build.
+        waiting = {}
+        for source in self.items:
+            if source in self.changed or source not in self.previous:
+                continue
+
+            dependencies = self.previous[source].get('dependencies', {})
+            for path, checksum in dependencies.get('files', {}).items():
+                if self.file_hash(os.path.join(self.site.path, path)) != checksum:
+                    self.changed.add(source)
+                    sources.add(source)
+                    break
+            else:
+                waiting[source] = dependencies
+
+        # Item is changed when it reads changed item, so repeat until nothing
+        # new is found.
+        found = True
+        while found:
+            found = False
+
+            for source, dependencies in list(waiting.items()):
+                queries = dependencies.get('queries', [])
+                if (sources.intersection(dependencies.get('items', [])) or
+                        queries and [i for i in sources if pathmatch(i, *queries)]):
+                    del waiting[source]
+                    self.changed.add(source)
+                    sources.add(source)
+                    found = True
+
+    def dependencies(self, source):
+        """Returns dependencies of item recorded in current build. Items which
+        were not rendered keep dependencies from previous build."""
+
+        dependencies = self.site.dependencies.get(source)
+
+        if source not in self.changed:
+            previous = self.previous.get(source, {}).get('dependencies', {})
+            for key in ('items', 'files', 'queries'):
+                dependencies[key] = sorted(set(dependencies[key]) |
+                                           set(previous.get(key, ())))
+
+        dependencies['files'] = {
+            i: self.file_hash(os.path.join(self.site.path, i))
+            for i in dependencies['files']
+        }
+        return dependencies
+
+    def is_changed(self, source):
+        """Returns True if item with given source has to be deployed."""
+        return source in self.changed
+
+    def fingerprint(self, item):
+        """Returns dict with item inputs."""
+
+        if item.path:
+            source = self.file_hash(item.path, getattr(item, 'stat', None))
+        else:
+            source = data_hash(item.data)
+
+        # Layout files used to render item.
+        layouts = {}
+        context = None
+        if getattr(item, 'layouts', None):
+            paths, context = item.layouts
+            for path in paths:
+                layouts[path] = self.file_hash(os.path.join(self.site.path, path))
+
+        return {
+            'source': source,
+            'layouts': layouts,
+            'renderers': [renderer_key(i) for i in item.renderers],
+            'output': item.output,
+            'metadata': data_hash([item.metadata.dump(), context]),
+        }
+
+    def remove_deleted(self):
+        """Removes files which were deployed by previous build, but they are not
+        used by any item in current build. Returns list of removed paths."""
+
+        outputs = {i['output'] for i in self.items.values()}
+        removed = []
+
+        for entry in self.previous.values():
+            if entry['output'] in outputs:
+                continue
+
+            path = os.path.join(self.site.output, entry['output'])
+            if os.path.isfile(path):
+                os.remove(path)
+                removed.append(path)
+        return removed
+
+
+    # Files.
+
+    def file_hash(self, path, stat=None):
+        """Returns hash of file content. Files with the same modification time
+        and size as in previous build are not read again. Optional stat is
+        os.stat() result of file, for example from item finder."""
+
+        key = os.path.relpath(path, self.site.path).replace('\\', '/')
+        if key in self.files:
+            return self.files[key][2]
+
+        if stat is None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+
+        previous = self.previous_files.get(key)
+        if previous and previous[:2] == [stat.st_mtime, stat.st_size]:
+            checksum = previous[2]
+        else:
+            checksum = hashlib.sha1()
+            with open(path, mode='rb') as file:
+                for chunk in iter(lambda: file.read(65536), b''):
+                    checksum.update(chunk)
+            checksum = checksum.hexdigest()
+
+        self.files[key] = [stat.st_mtime, stat.st_size, checksum]
+        return checksum
+
+
+
+def data_hash(data):
+    """Returns hash of given data, or None if data can not be serialized to
+    json. Items in data are represented by their source."""
+
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    elif not isinstance(data, (bytes, bytearray)):
+        try:
+            data = json.dumps(replace_items(data), sort_keys=True)
+        except (TypeError, ValueError, RecursionError):
+            return None
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+def replace_items(data, metadata=False):
+    """Returns copy of data with items replaced by their source. Reading other
+    items is recorded by dependency graph, so their metadata is not hashed. If
+    metadata is True, items are replaced by [source, metadata] list, and items
+    in their metadata only by source."""
+
+    if isinstance(data, BaseItem):
+        if metadata:
+            return [data.source, replace_items(data.dump())]
+        return data.source
+    if isinstance(data, dict):
+        return {key: replace_items(value, metadata) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [replace_items(i, metadata) for i in data]
+    return data
\ No newline at end of file
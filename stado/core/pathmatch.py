@@ -4,22 +4,148 @@ Paths comparing module.
 
 import re
 import os
+from functools import lru_cache
 
 
 def pathmatch(path, *patterns):
     """Returns True if path match one of given patterns."""
+    return matcher(*patterns).match(path)
 
-    path = os.path.normpath(path).replace('\\', '/')
 
-    for i in patterns:
-        i = os.path.normpath(i).replace('\\', '/')
-        if re.match(translate(i), path):
-            return True
-    return False
+def normalize(path):
+    """Returns path using posix format, for example 'a/b.html'."""
+    return os.path.normpath(path).replace('\\', '/')
 
 
-def translate(pat):
-    """From fnmatch.translate, translate a shell PATTERN to a regular expression."""
+@lru_cache(maxsize=256)
+def matcher(*patterns):
+    """Returns PathMatcher for given patterns. Matchers are reused."""
+    return PathMatcher(patterns)
+
+
+class PathMatcher:
+    """
+    Compiles many patterns once into one regular expression, so path is
+    compared with all patterns in one pass.
+    """
+
+    def __init__(self, patterns):
+
+        self.patterns = tuple(normalize(i) for i in patterns)
+
+        # Each pattern is a group, so group number is pattern index + 1.
+        if self.patterns:
+            self.regex = re.compile('(?ms)' + '|'.join(
+                '({}\\Z)'.format(translate(i, anchors=False))
+                for i in self.patterns))
+        else:
+            self.regex = None
+
+        # Expression used by indices(), compiled when it is first used.
+        self._all_regex = None
+
+    def match(self, path):
+        """Returns True if path match one of patterns."""
+        return self.first(path) is not None
+
+    def first(self, path):
+        """Returns index of first pattern matching path or None."""
+
+        if self.regex is None:
+            return None
+
+        match = self.regex.match(normalize(path))
+        if match is None:
+            return None
+        return match.lastindex - 1
+
+    def indices(self, path):
+        """Returns list of indices of all patterns matching path."""
+
+        if self.regex is None:
+            return []
+
+        # Each pattern is an optional lookahead group, so one match sets groups
+        # of all matching patterns.
+        if self._all_regex is None:
+            self._all_regex = re.compile('(?ms)' + ''.join(
+                '(?:(?=({}\\Z)))?'.format(translate(i, anchors=False))
+                for i in self.patterns))
+
+        groups = self._all_regex.match(normalize(path)).groups()
+        return [i for i, group in enumerate(groups) if group is not None]
+
+
+class MatchIndex:
+    """
+    Values registered with patterns, for example controllers functions. Values
+    matching each path are found once and remembered until next registration.
+    """
+
+    def __init__(self):
+
+        # List of (patterns, value) pairs in registration order.
+        self.entries = []
+        # Key is path, value is list of matching values.
+        self.cache = {}
+        self._matcher = None
+        # Index of entry using each pattern of matcher.
+        self._owners = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def add(self, patterns, value):
+        """Registers value used by paths matching one of given patterns."""
+
+        self.entries.append((tuple(patterns), value))
+        self.changed()
+
+    def set(self, patterns, value):
+        """Like add(), but replaces value of entry with the same patterns."""
+
+        patterns = tuple(patterns)
+        for i, (entry_patterns, _) in enumerate(self.entries):
+            if entry_patterns == patterns:
+                self.entries[i] = (patterns, value)
+                self.changed()
+                return
+        self.add(patterns, value)
+
+    def get(self, path):
+        """Returns list of values matching given path, in registration order."""
+
+        try:
+            return self.cache[path]
+        except KeyError:
+            pass
+
+        if self._matcher is None:
+            patterns = []
+            self._owners = []
+            for index, (entry_patterns, _) in enumerate(self.entries):
+                patterns.extend(entry_patterns)
+                self._owners.extend([index] * len(entry_patterns))
+            self._matcher = PathMatcher(patterns)
+
+        indices = sorted({self._owners[i] for i in self._matcher.indices(path)})
+        values = [self.entries[i][1] for i in indices]
+        self.cache[path] = values
+        return values
+
+    def changed(self):
+        """Forgets matched paths, used after registration."""
+
+        self.cache.clear()
+        self._matcher = None
+
+
+def translate(pat, anchors=True):
+    """From fnmatch.translate, translate a shell PATTERN to a regular expression.
+    If anchors is False, returned expression has no flags and end anchor."""
 
     i, n = 0, len(pat)
     res = ''
@@ -36,7 +162,7 @@ def translate(pat):
         i = i + 1
 
         if c == '*':
-            res = res + '[^\/\\\\]+'
+            res = res + r'[^/\\]+'
 
         elif c == '?':
             res = res + '.'
@@ -60,4 +186,6 @@ def translate(pat):
                 res = '%s[%s]' % (res, stuff)
         else:
             res = res + re.escape(c)
-    return res + '\Z(?ms)'
+    if not anchors:
+        return res
+    return '(?ms)' + res + r'\Z'
@@ -1,14 +1,20 @@
 import os
 import inspect
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from .loaders import FileSystemItemLoader
-from .item import ItemTypes
+from .item import ItemTypes, render_snapshot
 from .. import templates
-from .events import Events
+from .events import Events, EventsHandler
 from .. import controllers
 from .. import plugins
 from .. import config as CONFIG
-from .cache import ItemCache, DictCache
+from .cache import ItemCache, DictCache, RenderCache
+from .manifest import Manifest
+from .dependencies import DependencyGraph
+from .stats import Stats
+from ..errors import DeployError
 from .. import log
 
 
@@ -26,7 +32,12 @@ class Site(Events):
     def __init__(self, path=None, output=None, config=None,
                  template_engine='mustache',
                  cache=DictCache,
-                 loaders=(FileSystemItemLoader(),)):
+                 loaders=(FileSystemItemLoader(),),
+                 render_workers=1,
+                 deploy_workers=1,
+                 incremental=False,
+                 render_cache=False,
+                 copy_mode='copy'):
         """
         Arguments:
             path: Items will be created using files in this path. Default path is
@@ -38,6 +49,16 @@ class Site(Events):
             cache:
                 Cache class.
             loaders: List of ItemLoader classes used to create Items objects.
+            render_workers: Number of processes used to render items. If 1,
+                items are rendered in this process.
+            deploy_workers: Number of threads used to write items to output
+                directory. If 1, items are written in this process.
+            incremental: If True, items which were not changed since previous
+                build are not rendered and deployed again.
+            render_cache: If True, rendered items data is stored between builds
+                in site cache directory.
+            copy_mode: How files without rendering are written to output
+                directory: 'copy', 'hardlink' or 'reflink'.
         """
 
         Events.__init__(self)
@@ -60,6 +81,22 @@ class Site(Events):
         else:
             self._output = os.path.join(self.path, CONFIG.build_dir)
 
+        self._render_workers = render_workers
+        self.deploy_workers = deploy_workers
+        self._incremental = incremental
+        self._render_cache = render_cache
+        self._copy_mode = copy_mode
+
+        # RenderCache object used during building.
+        self.render_cache = None
+
+        # Inputs of items from previous build, used by incremental builds.
+        self.manifest = None
+        # Items and files read by controllers while building each item.
+        self.dependencies = DependencyGraph()
+        # Statistics of last build.
+        self.stats = Stats()
+
         # Paths pointing to files or directories which will be ignored.
         self.excluded_paths = []
 
@@ -93,6 +130,27 @@ class Site(Events):
             return CONFIG.output
         return self._output
 
+    @property
+    def render_workers(self):
+        if CONFIG.render_workers:
+            return CONFIG.render_workers
+        return self._render_workers
+
+    @property
+    def cache_path(self):
+        """Directory used to store data between builds."""
+        return os.path.join(self.path, CONFIG.cache_dir)
+
+    @property
+    def incremental(self):
+        return CONFIG.incremental or self._incremental
+
+    @property
+    def copy_mode(self):
+        if CONFIG.copy_mode:
+            return CONFIG.copy_mode
+        return self._copy_mode
+
 
     # Shortcuts.
 
@@ -138,13 +196,26 @@ class Site(Events):
 
         # Build site.
 
-        self.load()
-        self.render()
-        self.deploy()
+        try:
+            with self.stats.phase('load'):
+                self.load()
+            with self.stats.phase('render'):
+                self.render()
+            with self.stats.phase('deploy'):
+                self.deploy()
+
+            self.stats.cache = self.cache.get_stats()
+            self.stats.templates = self.template_engine.stats()
+
+            if CONFIG.explain:
+                log.info(self.dependencies.explain(CONFIG.explain))
+            if CONFIG.stats:
+                log.info(self.stats.report())
 
         # Remove cache.
 
-        self.clear()
+        finally:
+            self.clear()
 
 
     # Generating.
@@ -154,6 +225,17 @@ class Site(Events):
 
         log.debug('\tLoading site items...')
 
+        self.manifest = Manifest(self) if self.incremental else None
+        self.dependencies.clear()
+        self.stats.clear()
+        self.cache.reset_stats()
+        self.template_engine.reset_stats()
+
+        if self._render_cache and CONFIG.render_cache:
+            self.render_cache = RenderCache(os.path.join(self.cache_path, 'render'))
+        else:
+            self.render_cache = None
+
         # Controllers order.
         # Before loading:
         #   1) layout
@@ -161,11 +243,16 @@ class Site(Events):
         #   1) permalink
         #   2) before
 
+        # Controllers are subscribed once to events handler shared by items.
+        item_events = EventsHandler()
+        for i in self.controllers.values():
+            item_events.subscribe(i)
+
         # Use each content loader.
         for loader in self.loaders:
 
-            # Skip site output directory.
-            excluded_paths = self.excluded_paths + [self.output]
+            # Skip site output and cache directories.
+            excluded_paths = self.excluded_paths + [self.output, self.cache_path]
             for item in loader.load(self.path, excluded_paths):
 
                 log.debug('\t\t[ {0.type} ]  {0.source}'.format(item))
@@ -175,14 +262,17 @@ class Site(Events):
 
                 model = self.item_types(item.type)
                 item.set_type(model)
-
-                # Subscribe controller to item object events.
-                for i in self.controllers.values():
-                    item.events.subscribe(i)
+                item.render_cache = self.render_cache
+                item.copy_mode = self.copy_mode
+                item.events = item_events
+                self.stats.add_item(item)
 
                 # Loads item data and stores loaded item in cache.
-                self.cache.save_item(item.load())
+                with self.dependencies.building(item.source):
+                    item.load()
+                self.cache.save_item(item)
 
+        self.cache.flush()
         return self
 
 
@@ -199,21 +289,194 @@ class Site(Events):
         #   2) helper
         #   3) after
 
-        for item in self.cache:
-            self.cache.save_item(item.render())
+        # Finds items changed since previous build.
+        if self.manifest is not None:
+            self.manifest.update(self.cache)
+
+        if self.render_workers > 1:
+            self.render_parallel(self.render_workers)
+        else:
+            for item in self.changed_items():
+                timings = []
+                with self.dependencies.building(item.source):
+                    item.render(timings)
+                self.stats.add_timings(item.source, timings)
+                self.cache.save_item(item)
+
+        self.cache.flush()
+        if self.render_cache is not None:
+            self.render_cache.prune()
         return self
 
 
+    def render_parallel(self, workers, batch_size=64):
+        """Renders items using pool of processes. Only renderers are run in
+        workers, items events are run in this process in the same order as
+        items in cache."""
+
+        log.debug('\t\tUsing {} render workers.'.format(workers))
+
+        with ProcessPoolExecutor(workers) as executor:
+
+            # Items are send to workers in batches, so only some of them are
+            # loaded from cache at the same time.
+            batch = []
+            for item in self.changed_items():
+                batch.append(item)
+                if len(batch) == workers * batch_size:
+                    self._render_batch(executor, batch)
+                    batch = []
+            self._render_batch(executor, batch)
+
+        return self
+
+    def _render_batch(self, executor, batch):
+        """Renders list of items using executor and stores them in cache. Each
+        item is rendered here or gets its rendered data just before its after
+        rendering event, so other items loaded from cache by previous events do
+        not replace it."""
+
+        cache = self.render_cache
+
+        jobs = []
+        for item in batch:
+            with self.dependencies.building(item.source):
+                item.event('item.before_rendering', item)
+
+            # Events of previous items can load this item from cache again, so
+            # its data and metadata are restored before rendering ends.
+            data, metadata = item.data, item.metadata.dump()
+            future = key = None
+            local = False
+
+            # Items without renderers, for example images, are not send to
+            # workers.
+            if item.renderers:
+                # Data rendered in previous builds.
+                key = cache.key(item) if cache is not None else None
+                rendered = cache.load(key) if key is not None else None
+
+                if rendered is not None:
+                    data = rendered
+                else:
+                    # Some items can not be pickled, they are rendered here.
+                    snapshot = item.snapshot()
+                    if snapshot is None:
+                        local = True
+                    else:
+                        future = executor.submit(render_snapshot, snapshot)
+
+            jobs.append((data, metadata, key, future, local))
+
+        for item, (data, metadata, key, future, local) in zip(batch, jobs):
+            item.data, item.metadata = data, metadata
+
+            with self.dependencies.building(item.source):
+                if local:
+                    timings = []
+                    item.run_renderers(timings)
+                    self.stats.add_timings(item.source, timings)
+                elif future is not None:
+                    item.data, timings = future.result()
+                    self.stats.add_timings(item.source, timings)
+                    if key is not None:
+                        cache.save(key, item.data)
+
+                item.event('item.after_rendering', item)
+            self.cache.save_item(item)
+
+
     def deploy(self):
         """Writes items to output directory."""
 
         log.debug('\tDeploying items...')
 
-        for item in self.cache:
-            log.debug('\t\t{} => {}'.format(item.source, item.output))
-            item.deploy(self.output)
+        # Removes output files of deleted items.
+        if self.manifest is not None:
+            for path in self.manifest.remove_deleted():
+                log.debug('\t\tRemoved: {}'.format(path))
+
+        if self.deploy_workers > 1:
+            self.deploy_parallel(self.deploy_workers)
+        else:
+            for item in self.changed_items():
+                log.debug('\t\t{} => {}'.format(item.source, item.output))
+                self.stats.add_deployed(item.deploy(self.output))
+
+        if self.manifest is not None:
+            self.manifest.save()
+        return self
+
+
+    def deploy_parallel(self, workers, queue_size=None):
+        """Writes items to output directory using pool of threads. Output
+        directories are created once before writing. Items which failed to
+        deploy are logged and DeployError is raised after all other items were
+        written."""
+
+        log.debug('\t\tUsing {} deploy workers.'.format(workers))
+
+        # Maximum number of items waiting for writing, next items are loaded
+        # from cache only when first of them is written.
+        if queue_size is None:
+            queue_size = workers * 2
+
+        directories = {os.path.dirname(os.path.join(self.output, i))
+                       for i in self.cache.outputs}
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+
+        failures = []
+
+        with ThreadPoolExecutor(workers) as executor:
+            jobs = deque()
+
+            for item in self.changed_items():
+                log.debug('\t\t{} => {}'.format(item.source, item.output))
+                item.event('item.before_deploying', item)
+
+                # Deployers without write() method create directories itself.
+                write = getattr(item.deployer, 'write', item.deployer.deploy)
+                path = os.path.join(self.output, item.output)
+                jobs.append((item, executor.submit(write, item, path)))
+
+                if len(jobs) >= queue_size:
+                    self._finish_deploy(*jobs.popleft(), failures=failures)
+
+            while jobs:
+                self._finish_deploy(*jobs.popleft(), failures=failures)
+
+        if failures:
+            raise DeployError(failures)
         return self
 
+    def _finish_deploy(self, item, job, failures):
+        """Waits for item deploying job and runs item events."""
+
+        try:
+            self.stats.add_deployed(job.result() is not False)
+        except Exception as error:
+            log.error('Failed to deploy {}: {}'.format(item.source, error))
+            failures.append((item.source, error))
+        else:
+            item.event('item.after_deploying', item)
+
+
+    def changed_items(self):
+        """Yields items from cache which have to be rendered and deployed.
+        During incremental builds items not changed since previous build are
+        skipped."""
+
+        if self.manifest is None:
+            for item in self.cache:
+                yield item
+        else:
+            for source in list(self.cache.sources):
+                if self.manifest.is_changed(source):
+                    yield self.cache.load_item(source)
+                else:
+                    log.debug('\t\tNot changed: {}'.format(source))
+
 
     # Cleaning.
 
@@ -0,0 +1,117 @@
+"""
+Site building statistics.
+"""
+
+import heapq
+from collections import OrderedDict, Counter
+from contextlib import contextmanager
+
+from ..utils import Timer
+
+
+class Stats:
+    """
+    Statistics of last site build: time of each building step, number of items
+    of each type, cache usage and the slowest items of each renderer.
+    """
+
+    def __init__(self, slowest=5):
+
+        # Number of items stored for each renderer.
+        self.slowest = slowest
+        self.clear()
+
+
+    def clear(self):
+        """Removes statistics of previous build."""
+
+        # Key is step name, value is time in seconds.
+        self.phases = OrderedDict()
+        # Key is item type, for example 'html', value is number of items.
+        self.types = Counter()
+        # Statistics of ItemCache and cache class.
+        self.cache = {}
+        # Key is renderer name, value is heap of (seconds, item source) pairs.
+        self.renderers = {}
+        # Statistics of site template engine.
+        self.templates = {}
+        # Number of written output files and files which were up to date.
+        self.deployed = {'written': 0, 'skipped': 0}
+
+    @contextmanager
+    def phase(self, name):
+        """Measures time of code run inside with statement."""
+
+        timer = Timer()
+        try:
+            yield
+        finally:
+            self.phases[name] = timer.elapsed
+
+    def add_item(self, item):
+        """Counts loaded item."""
+        self.types[item.type] += 1
+
+    def add_deployed(self, written):
+        """Counts deployed item, written is False if output was up to date."""
+        self.deployed['written' if written else 'skipped'] += 1
+
+    def add_timings(self, source, timings):
+        """Stores list of (renderer name, seconds) pairs of given item."""
+
+        for renderer, seconds in timings:
+            heap = self.renderers.setdefault(renderer, [])
+            if len(heap) < self.slowest:
+                heapq.heappush(heap, (seconds, source))
+            else:
+                heapq.heappushpop(heap, (seconds, source))
+
+    def slowest_items(self, renderer):
+        """Returns list of (seconds, item source) pairs, the slowest first."""
+        return sorted(self.renderers.get(renderer, []), reverse=True)
+
+
+    def dump(self):
+        """Returns dict with all statistics."""
+
+        return {
+            'phases': dict(self.phases),
+            'types': dict(self.types),
+            'cache': dict(self.cache),
+            'deployed': dict(self.deployed),
+            'templates': dict(self.templates),
+            'renderers': {i: self.slowest_items(i) for i in self.renderers},
+        }
+
+    def report(self):
+        """Returns statistics as a message."""
+
+        lines = ['Statistics:']
+
+        lines.append('  Time: ' + ', '.join(
+            '{} {:.2f}s'.format(name, seconds)
+            for name, seconds in self.phases.items()))
+
+        lines.append('  Items: ' + ', '.join(
+            '{} {}'.format(name or 'other', number)
+            for name, number in sorted(self.types.items(), key=lambda x: str(x[0]))))
+
+        if self.cache:
+            lines.append('  Cache: ' + ', '.join(
+                '{} {}'.format(key.replace('_', ' '), value)
+                for key, value in sorted(self.cache.items())))
+
+        lines.append('  Deployed: {written} written, {skipped} not changed'.format(
+            **self.deployed))
+
+        if self.templates:
+            lines.append('  Templates: ' + ', '.join(
+                '{} {}'.format(key.replace('_', ' '), value)
+                for key, value in sorted(self.templates.items())))
+
+        for renderer in sorted(self.renderers):
+            lines.append('  Slowest items rendered by {}:'.format(renderer))
+            for seconds, source in self.slowest_items(renderer):
+                lines.append('    {:.4f}s {}'.format(seconds, source))
+
+        return '\n'.join(lines)
@@ -1,3 +1,14 @@
 class StadoError(Exception):
     """Base class for stado exceptions."""
-    pass
\ No newline at end of file
+    pass
+
+
+class DeployError(StadoError):
+    """Raises when some items failed to deploy. Property failures is list of
+    (item source, exception) pairs."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        sources = ', '.join(source for source, error in failures)
+        StadoError.__init__(self, 'Failed to deploy {} items: {}'.format(
+            len(failures), sources))
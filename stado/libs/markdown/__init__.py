@@ -191,7 +191,8 @@ class Markdown(object):
         # Setup the module name
         module_name = ext_name
         if '.' not in ext_name:
-            module_name = '.'.join(['markdown.extensions', ext_name])
+            # Package is bundled with stado, so it is not "markdown".
+            module_name = '.'.join([__name__, 'extensions', ext_name])
 
         # Try loading the extension first from one place, then another
         try: # New style (markdown.extensons.<extension>)
@@ -0,0 +1,111 @@
+# coding: utf-8
+
+"""
+Compiles a ParsedTemplate instance to a Python function.
+
+The generated function renders the same string as ParsedTemplate.render(),
+but without calling render() of each node: text is appended to one list,
+section loops are inlined and engine methods are bound to local names.
+
+"""
+
+from .parser import (_CommentNode, _ChangeNode, _EscapeNode, _LiteralNode,
+                     _InvertedNode, _SectionNode)
+
+
+class CompiledTemplate(object):
+
+    """
+    Wraps a function generated from a ParsedTemplate instance.  It has the
+    same render(engine, context) method as ParsedTemplate.
+
+    """
+
+    def __init__(self, parsed_template):
+        self.source, self.render = compile_template(parsed_template)
+
+    def __repr__(self):
+        return 'CompiledTemplate(%r)' % self.source
+
+
+def compile_template(parsed_template):
+    """
+    Return (source, function) pair, where function accepts RenderEngine
+    and ContextStack instances and returns a unicode string.
+
+    """
+    compiler = _Compiler()
+    compiler.line('def render(engine, context):', 0)
+    compiler.line('fetch_string = engine.fetch_string', 1)
+    compiler.line('fetch_section_data = engine.fetch_section_data', 1)
+    compiler.line('resolve_context = engine.resolve_context', 1)
+    compiler.line('escape = engine.escape', 1)
+    compiler.line('literal = engine.literal', 1)
+    compiler.line('push = context.push', 1)
+    compiler.line('pop = context.pop', 1)
+    compiler.line('parts = []', 1)
+    compiler.line('append = parts.append', 1)
+    compiler.template(parsed_template, 1)
+    compiler.line("return ''.join(parts)", 1)
+
+    source = '\n'.join(compiler.lines)
+    namespace = {'nodes': compiler.nodes}
+    exec(compile(source, '<mustache>', 'exec'), namespace)
+
+    return source, namespace['render']
+
+
+class _Compiler(object):
+
+    def __init__(self):
+        self.lines = []
+        # Nodes rendered by their own render() method, for example partials.
+        self.nodes = []
+
+    def line(self, code, indent):
+        self.lines.append('    ' * indent + code)
+
+    def template(self, parsed_template, indent):
+        start = len(self.lines)
+
+        for node in parsed_template._parse_tree:
+            self.node(node, indent)
+
+        # Empty section body.
+        if len(self.lines) == start:
+            self.line('pass', indent)
+
+    def node(self, node, indent):
+        if type(node) is str:
+            self.line('append(%r)' % node, indent)
+
+        elif isinstance(node, (_CommentNode, _ChangeNode)):
+            pass
+
+        elif isinstance(node, _EscapeNode):
+            self.line('append(escape(fetch_string(context, %r)))' % node.key, indent)
+
+        elif isinstance(node, _LiteralNode):
+            self.line('append(literal(fetch_string(context, %r)))' % node.key, indent)
+
+        elif isinstance(node, _InvertedNode):
+            self.line('if not resolve_context(context, %r):' % node.key, indent)
+            self.template(node.parsed_section, indent + 1)
+
+        elif isinstance(node, _SectionNode):
+            # Same as _SectionNode.render(), lambdas get unprocessed section.
+            template = node.template[node.index_begin:node.index_end]
+            self.line('for value in fetch_section_data(context, %r):' % node.key, indent)
+            self.line('if callable(value):', indent + 1)
+            self.line('append(engine._render_value(value(%r), context, '
+                      'delimiters=%r))' % (template, node.delimiters), indent + 2)
+            self.line('continue', indent + 2)
+            self.line('push(value)', indent + 1)
+            self.template(node.parsed, indent + 1)
+            self.line('pop()', indent + 1)
+
+        else:
+            # Partials and unknown nodes.
+            self.nodes.append(node)
+            self.line('append(nodes[%d].render(engine, context))'
+                      % (len(self.nodes) - 1), indent)
@@ -7,7 +7,7 @@ The Mustache spec makes a special distinction between two types of context
 stack elements: hashes and objects.  For the purposes of interpreting the
 spec, we define these categories mutually exclusively as follows:
 
- (1) Hash: an item whose type is a subclass of dict.
+ (1) Hash: an item whose type is a mapping, for example a subclass of dict.
 
  (2) Object: an item that is neither a hash nor an instance of a
      built-in type.
@@ -16,6 +16,7 @@ spec, we define these categories mutually exclusively as follows:
 
 from .common import PystacheError
 import collections
+from collections.abc import Mapping
 
 
 # This equals '__builtin__' in Python 2 and 'builtins' in Python 3.
@@ -44,7 +45,7 @@ def _get_value(context, key):
     The ContextStack.get() docstring documents this function's intended behavior.
 
     """
-    if isinstance(context, dict):
+    if isinstance(context, Mapping):
         # Then we consider the argument a "hash" for the purposes of the spec.
         #
         # We do a membership test to avoid using exceptions for flow control
@@ -6,9 +6,13 @@ Defines a class responsible for rendering logic.
 """
 
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 
 from .common import is_string
 from .parser import parse
+from .compiler import CompiledTemplate
 import collections
 
 
@@ -20,6 +24,70 @@ def context_get(stack, name):
     return stack.get(name)
 
 
+class ParsedTemplateCache(object):
+
+    """
+    Bounded cache of ParsedTemplate instances, so the same template text
+    is parsed once.  The least recently used templates are removed when
+    more than max_size templates are stored.
+
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def parse(self, template, delimiters=None, compiled=False):
+        """
+        Return ParsedTemplate of the template, parsing it if it is not cached.
+        If compiled is True, return CompiledTemplate instead.
+
+        """
+        key = (template, tuple(delimiters) if delimiters else None, compiled)
+
+        with self._lock:
+            parsed_template = self._templates.get(key)
+            if parsed_template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return parsed_template
+            self.misses += 1
+
+        parsed_template = parse(template, delimiters)
+        if compiled:
+            parsed_template = CompiledTemplate(parsed_template)
+
+        with self._lock:
+            self._templates[key] = parsed_template
+            if len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+
+        return parsed_template
+
+    def stats(self):
+        """
+        Return dict with number of hits, misses and hit rate.
+
+        """
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0}
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+# Cache shared by all RenderEngine instances.
+parsed_templates = ParsedTemplateCache()
+
+
 class RenderEngine(object):
 
     """
@@ -39,6 +107,9 @@ class RenderEngine(object):
 
     """
 
+    # If True, templates are compiled to Python functions.
+    compiled = False
+
     # TODO: it would probably be better for the constructor to accept
     #   and set as an attribute a single RenderResolver instance
     #   that encapsulates the customizable aspects of converting
@@ -146,8 +217,8 @@ class RenderEngine(object):
                 # Then the value does not support iteration.
                 data = [data]
             else:
-                if is_string(data) or isinstance(data, dict):
-                    # Do not treat strings and dicts (which are iterable) as lists.
+                if is_string(data) or isinstance(data, Mapping):
+                    # Do not treat strings and mappings (which are iterable) as lists.
                     data = [data]
                 # Otherwise, treat the value as a list.
 
@@ -177,6 +248,7 @@ class RenderEngine(object):
           context_stack: a ContextStack instance.
 
         """
-        parsed_template = parse(template, delimiters)
+        parsed_template = parsed_templates.parse(template, delimiters,
+                                                 self.compiled)
 
         return parsed_template.render(self, context_stack)
@@ -11,6 +11,9 @@ class Extension(Plugin):
 
     deployer = None
 
+    # If True, files are read as bytes, not as text.
+    binary = False
+
 
     def __init__(self, site):
 
@@ -22,12 +25,13 @@ class Extension(Plugin):
         # Model with supporting any extension.
         if self.extensions is None:
             self.site.item_types.set(None, self.loaders, self.renderers,
-                                     self.deployer)
+                                     self.deployer, binary=self.binary)
         else:
             for e in self.extensions:
                 self.site.item_types.set(e, loaders=self.loaders,
                                          renderers=self.renderers,
-                                         deployers=self.deployer)
+                                         deployers=self.deployer,
+                                         binary=self.binary)
 
 
     def _update_template_engine(self, renderers):
@@ -1,13 +1,24 @@
 import os
+import locale
 import shutil
+from stat import S_IMODE
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# Linux ioctl creating reflink of file.
+FICLONE = 0x40049409
 
 
 class CopyDeployer:
 
     url = None
 
-    @staticmethod
-    def deploy(content, path):
+    @classmethod
+    def deploy(cls, content, path):
         """Copy content source file to patch."""
 
         directory_path = os.path.split(path)[0]
@@ -17,7 +28,75 @@ class CopyDeployer:
         if not os.path.exists(directory_path):
             os.makedirs(directory_path)
 
-        shutil.copy(content.path, path)
+        return cls.write(content, path)
+
+    @classmethod
+    def write(cls, content, path):
+        """Copy content source file to path, directory must already exist. Uses
+        copy_mode of content set by site. Files with the same size and modification time as
+        source are not copied again, then False is returned."""
+
+        stat = getattr(content, 'stat', None) or os.stat(content.path)
+
+        try:
+            output = os.stat(path)
+        except OSError:
+            output = None
+        else:
+            if (output.st_size == stat.st_size and
+                    output.st_mtime_ns == stat.st_mtime_ns):
+                return False
+
+        copy_mode = getattr(content, 'copy_mode', 'copy')
+
+        if copy_mode == 'hardlink':
+            if output is not None:
+                os.remove(path)
+            try:
+                os.link(content.path, path)
+                return True
+            except OSError:
+                # For example other file system.
+                pass
+
+        if copy_mode == 'reflink':
+            cls.reflink(content.path, path)
+        else:
+            shutil.copyfile(content.path, path)
+
+        # Permission bits and modification time are copied, so the file is
+        # not copied again in next build.
+        os.chmod(path, S_IMODE(stat.st_mode))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        return True
+
+    @staticmethod
+    def reflink(source, path):
+        """Copies file using reflink or copy_file_range() if file system
+        supports them, otherwise copies data."""
+
+        with open(source, mode='rb') as src, open(path, mode='wb') as dst:
+
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                    return
+                except OSError:
+                    pass
+
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while os.copy_file_range(src.fileno(), dst.fileno(),
+                                             1024 * 1024 * 1024):
+                        pass
+                    return
+                except OSError:
+                    # Part of file could be copied already.
+                    src.seek(0)
+                    dst.seek(0)
+                    dst.truncate()
+
+            shutil.copyfileobj(src, dst)
 
 
 
@@ -25,9 +104,13 @@ class DataDeployer:
 
     url = None
 
+    # If True, files which already have the same content are not written, so
+    # their modification time is not changed.
+    write_if_changed = True
 
-    @staticmethod
-    def deploy(content, path):
+
+    @classmethod
+    def deploy(cls, content, path):
         """Copy content data file to patch."""
 
         directory_path = os.path.split(path)[0]
@@ -36,6 +119,35 @@ class DataDeployer:
         if not os.path.exists(directory_path):
             os.makedirs(directory_path)
 
+        return cls.write(content, path)
+
+    @classmethod
+    def write(cls, content, path):
+        """Writes content data to path, directory must already exist. Returns
+        False if file already has the same content and it was not written."""
+
+        data = content.data
+        if isinstance(data, str):
+            # The same bytes as written by file opened in text mode.
+            if os.linesep != '\n':
+                data = data.replace('\n', os.linesep)
+            data = data.encode(locale.getpreferredencoding(False))
+
+        if cls.write_if_changed and is_written(path, data):
+            return False
+
+        with open(path, mode='wb') as file:
+            file.write(data)
+        return True
+
+
+def is_written(path, data):
+    """Returns True if file in path has given bytes-like data."""
 
-        with open(path, mode='w') as file:
-            file.write(content.data)
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, mode='rb') as file:
+            return file.read() == data
+    except OSError:
+        return False
@@ -12,5 +12,8 @@ class Default(Extension):
 
     deployer = CopyDeployer
 
+    # Files are copied, so they can be anything.
+    binary = True
+
 
 
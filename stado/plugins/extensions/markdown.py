@@ -1,10 +1,71 @@
+import json
+import threading
+
 from .html import HTMLDeployer
 from .. import Extension
+from ...core.item import renderer_name
 from ...libs import markdown
 
 
-def render(source, metadata):
-    return markdown.markdown(source)
+class MarkdownRenderer:
+    """
+    Converts markdown to html. Each thread uses one Markdown object, which is
+    reset after each page instead of creating new one.
+    """
+
+    def __init__(self, extensions=()):
+        """
+        Args:
+            extensions: List of markdown extensions names or objects.
+        """
+
+        self.extensions = list(extensions)
+        self._local = threading.local()
+
+    def __call__(self, source, metadata):
+
+        converter = getattr(self._local, 'converter', None)
+        if converter is None:
+            converter = markdown.Markdown(extensions=self.extensions)
+            self._local.converter = converter
+
+        try:
+            return converter.convert(source)
+        finally:
+            converter.reset()
+
+    @property
+    def cache_key(self):
+        """Renderer options, used to find pages rendered using other ones."""
+
+        return ','.join(extension_key(i) for i in self.extensions)
+
+    # Thread local converters are not pickled, for example when renderer is
+    # sent to render workers processes.
+
+    def __getstate__(self):
+        return {'extensions': self.extensions}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+def extension_key(extension):
+    """Returns extension name, or class name with configuration of extension
+    object. Values which are not json, for example functions, are represented
+    by their names."""
+
+    if isinstance(extension, str):
+        return extension
+
+    get_configs = getattr(extension, 'getConfigs', None)
+    configs = get_configs() if get_configs is not None else {}
+    return '{}{}'.format(renderer_name(extension),
+                         json.dumps(configs, sort_keys=True, default=renderer_name))
+
+
+# Renderer without extensions.
+render = MarkdownRenderer()
 
 
 class Markdown(Extension):
@@ -17,5 +78,12 @@ class Markdown(Extension):
 
     deployer = HTMLDeployer
 
+    def __init__(self, site):
 
+        # Markdown extensions are set in site configuration.
+        extensions = site.config.get('markdown_extensions')
+        if extensions:
+            self.renderers = [MarkdownRenderer(extensions) if i is render else i
+                              for i in self.renderers]
 
+        Extension.__init__(self, site)
@@ -18,6 +18,24 @@ class TemplateEngine:
     def __init__(self, path=None):
         self.path = path
 
+    def render_file(self, path, context):
+        """Renders template file with given context. Path is absolute."""
+
+        with open(path) as file:
+            return self.render(file.read(), context)
+
+    def loads_files(self, source):
+        """Returns True if rendering source can read other template files, then
+        rendered data is not stored in render cache."""
+        return True
+
+    def stats(self):
+        """Returns dict with engine statistics, for example cache usage."""
+        return {}
+
+    def reset_stats(self):
+        pass
+
 
 # All available template engines must be imported.
 
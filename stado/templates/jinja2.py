@@ -1,8 +1,14 @@
 """
 Support for Jinja2 templates.
 """
+import os
+import re
+import hashlib
 import importlib
+from collections import OrderedDict
+
 from . import TemplateEngine
+from .. import config as CONFIG
 
 
 # Template engine class.
@@ -16,6 +22,12 @@ class Jinja2(TemplateEngine):
 
     jinja2 = None
 
+    # Maximum number of compiled templates files stored in memory.
+    max_templates = 256
+
+    # Tags reading other templates files using loader.
+    loader_tag = re.compile(r'\{%[-+]?\s*(extends|include|import|from)\b')
+
 
     @classmethod
     def check_requirements(cls):
@@ -35,9 +47,59 @@ class Jinja2(TemplateEngine):
         # Jinja2 environment set to site source path.
         self.environment = self.jinja2.Environment(loader=loader)
 
+        # Compiled templates files, key is hash of template source.
+        self.templates = OrderedDict()
+
+        # Templates files compiled in previous builds are stored in site cache
+        # directory.
+        self.bytecode_path = os.path.join(path, CONFIG.cache_dir, 'jinja2')
+        self.bytecode_cache = self.jinja2.FileSystemBytecodeCache(self.bytecode_path)
+
+
+    def loads_files(self, source):
+        """Returns True if template can read other templates using loader."""
+        return self.loader_tag.search(source) is not None
 
     def render(self, source: str, context: dict):
         """Renders source with given context."""
 
         template = self.environment.from_string(source)
         return template.render(**context)
+
+    def render_file(self, path, context):
+        """Renders template file with given context. File is compiled once."""
+
+        with open(path) as file:
+            source = file.read()
+
+        key = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        template = self.templates.get(key)
+
+        if template is None:
+            template = self.compile_file(path, source)
+            self.templates[key] = template
+            if len(self.templates) > self.max_templates:
+                self.templates.popitem(last=False)
+        else:
+            self.templates.move_to_end(key)
+
+        return template.render(**context)
+
+    def compile_file(self, path, source):
+        """Returns Template object, using bytecode cache like jinja2 loaders."""
+
+        environment = self.environment
+        name = os.path.relpath(path, self.path).replace('\\', '/')
+
+        bucket = self.bytecode_cache.get_bucket(environment, name, path, source)
+        code = bucket.code
+
+        if code is None:
+            code = environment.compile(source, name, path)
+            bucket.code = code
+
+            os.makedirs(self.bytecode_path, exist_ok=True)
+            self.bytecode_cache.set_bucket(bucket)
+
+        return environment.template_class.from_code(
+            environment, code, environment.make_globals(None), None)
@@ -2,31 +2,39 @@
 Support for Mustache templates using pystache module.
 """
 
+import re
+
 from ..libs import pystache
+from ..libs.pystache.renderengine import parsed_templates
 from . import TemplateEngine
 
 
 # Hacking pystache context.
 
 class Context(dict):
-    """Template context."""
+    """Template context. Callable values are helpers functions, they are called
+    only when template uses them."""
 
     def __getitem__(self, item):
 
+        value = dict.__getitem__(self, item)
+
         # Item is helper function.
-        result = getattr(self, 'helper_' + item, None)
-        if result:
-            return result
+        if callable(value):
+            result = value()
+            if result:
+                return result
         # Standard item.
-        return dict.__getitem__(self, item)
+        return value
 
-class Helper:
-    """Helper function as a property."""
 
-    def __init__(self, f):
-        self.f = f
-    def __get__(self, instance, owner):
-        return self.f()
+class CompiledRenderer(pystache.Renderer):
+    """Renderer using templates compiled to Python functions."""
+
+    def _make_render_engine(self):
+        engine = pystache.Renderer._make_render_engine(self)
+        engine.compiled = True
+        return engine
 
 
 # Template engine class.
@@ -37,27 +45,28 @@ class Mustache(TemplateEngine):
     name = 'mustache'
     requirements = 'Require pystache module! http://github.com/defunkt/pystache'
 
+    # If True, templates are compiled to Python functions, which render
+    # faster the same output.
+    compiled = False
 
-    def render(self, source: str, context: dict):
-        """Renders source with given context."""
-
-        # Creating new class which will be used as a template context.
-        context_class = type('RenderContext', (Context,), {})
+    def stats(self):
+        """Returns usage of parsed templates cache."""
+        return parsed_templates.stats()
 
-        # All callable objects in context.
-        helpers = {}
+    def reset_stats(self):
+        parsed_templates.reset_stats()
 
-        for key, value in context.items():
+    # Partial tag, or set delimiter tag which can change partial tags.
+    partial_tag = re.compile(r'\{\{\s*[>=]')
 
-            # Install each callable object as a context class property.
-            if callable(value):
-                setattr(context_class, 'helper_' + key, Helper(value))
-                helpers[key] = value
+    def loads_files(self, source):
+        """Returns True if template can use partials, they are read from files."""
+        return self.partial_tag.search(source) is not None
 
-        # Helper function is run only when context dict has it name as a key.
-        # Use template context class to create dict.
-        render_context = context_class(context)
+    def render(self, source: str, context: dict):
+        """Renders source with given context."""
 
-        result = pystache.render(source, render_context)
+        renderer = CompiledRenderer() if self.compiled else pystache.Renderer()
 
-        return result
+        # Helper function is run only when template uses its name.
+        return renderer.render(source, Context(context))
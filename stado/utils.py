@@ -6,15 +6,20 @@ import shutil
 
 
 class Timer:
-    """Timer. Use get() method to get how much time has passed since this
-    object creation."""
+    """Timer using monotonic clock. Use get() method to get how much time has
+    passed since this object creation."""
 
     def __init__(self):
-        self.time = time.clock()
+        self.time = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        """Seconds passed since this object creation, not rounded."""
+        return time.perf_counter() - self.time
 
     def get(self):
         """Returns how much time has passed since this object creation."""
-        return round(time.clock() - self.time, 2)
+        return round(self.elapsed, 2)
 
 
 def copytree(source, destination):
@@ -74,6 +74,48 @@ class TestBuildSite(TestCommand):
         shutil.rmtree(output_path)
 
 
+    def test_jobs_option(self):
+        """--jobs: should render site using multiple processes."""
+
+        self.assertTrue(Console().__call__('build a --jobs 2'))
+
+        build_directory = os.path.join(self.temp_path, 'a', config.build_dir)
+        with open(os.path.join(build_directory, 'a.html')) as page:
+            self.assertEqual('hello world', page.read())
+        # Option should not be used by next builds.
+        self.assertIsNone(config.render_workers)
+
+
+    def test_explain_option(self):
+        """--explain: should build site and show source dependencies."""
+
+        self.assertTrue(Console().__call__('build a --explain a.html'))
+        self.assertIsNone(config.explain)
+
+    def test_stats_option(self):
+        """--stats: should build site and show statistics."""
+
+        self.assertTrue(Console().__call__('build a --stats'))
+        self.assertFalse(config.stats)
+
+    def test_copy_mode_option(self):
+        """--copy-mode: should build site using given mode."""
+
+        self.assertTrue(Console().__call__('build a --copy-mode reflink'))
+        self.assertIsNone(config.copy_mode)
+
+    def test_failed_build_options(self):
+        """should reset options after failed building."""
+
+        self.assertFalse(Console().__call__('build missing -o out -j 2 -i '
+                                            '--stats --copy-mode hardlink'))
+        self.assertIsNone(config.output)
+        self.assertIsNone(config.render_workers)
+        self.assertFalse(config.incremental)
+        self.assertFalse(config.stats)
+        self.assertIsNone(config.copy_mode)
+
+
 
 class TestBuildWithoutArguments(TestCommand):
     """Command build:
@@ -38,6 +38,22 @@ class TestAfter(TestPlugin):
             self.assertEqual('page.html', page.read())
 
 
+    def test_keyword_arguments(self):
+        """Controller after should call function with keyword-only arguments."""
+
+        # site.py
+
+        @self.app.after('page.html')
+        def test(data, **kwargs):
+            return kwargs['item'].source + data
+        self.app.run()
+
+        # tests
+
+        with open('page.html') as page:
+            self.assertEqual('page.htmlbadger', page.read())
+
+
     def test_data_argument(self):
         """Controller after should call function with correct data argument."""
 
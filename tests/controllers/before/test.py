@@ -39,6 +39,22 @@ class TestBefore(TestPlugin):
             self.assertEqual('page.html', page.read())
 
 
+    def test_keyword_argument(self):
+        """Before plugin should call function with keyword-only item argument."""
+
+        # site.py
+
+        @self.app.before('page.html')
+        def test(*, item):
+            return {'badger': item.source}
+        self.app.run()
+
+        # tests
+
+        with open('page.html') as page:
+            self.assertEqual('page.html', page.read())
+
+
     def test_update_page_variables(self):
         """Before plugin can change page variables directly."""
 
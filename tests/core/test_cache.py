@@ -1,6 +1,11 @@
 import os
 
-from stado.core.cache import ShelveCache
+from stado import config
+from stado.core.cache import ShelveCache, SQLiteCache, TieredCache, RenderCache
+from stado.core.cache import Compressor
+from stado.core.item import SiteItem
+from stado.core.site import Site
+from stado.utils import copytree
 from tests import TestTemporaryDirectory
 
 
@@ -18,3 +23,315 @@ class TestShelveCache(TestTemporaryDirectory):
         self.assertEqual(1, cache.load('a'))
         # Test if files were created.
         self.assertTrue(os.listdir(self.temp_path))
+
+
+    def test_waiting_values(self):
+        """Cache should return saved and removed values before writing them."""
+
+        cache = ShelveCache(self.temp_path, batch_size=2)
+        cache.save('a', 1)
+        cache.remove('a')
+        self.assertIsNone(cache.load('a'))
+
+        cache.save('b', 2)
+        cache.save('c', 3)
+        cache.remove('b')
+        self.assertIsNone(cache.load('b'))
+        self.assertEqual(3, cache.load('c'))
+
+        cache.flush()
+        self.assertFalse(cache.waiting)
+        self.assertIsNone(cache.load('b'))
+        self.assertEqual(3, cache.load('c'))
+
+
+    def test_clear(self):
+        """Cache should remove files and can be used again after clearing."""
+
+        cache = ShelveCache(self.temp_path)
+        cache.save('a', 1)
+        cache.flush()
+        cache.clear()
+
+        self.assertFalse(os.listdir(self.temp_path))
+
+        cache.save('a', 2)
+        cache.close()
+        self.assertEqual(2, cache.load('a'))
+        cache.clear()
+
+
+
+class TestSQLiteCache(TestTemporaryDirectory):
+    """
+    Important!
+    This test creates temporary directory which is available as self.temp_path.
+    """
+
+    def test_dict(self):
+
+        cache = SQLiteCache(self.temp_path)
+        cache.save('a', {'b': 1})
+        cache.save('c', 'd')
+        cache.remove('c')
+
+        self.assertEqual({'b': 1}, cache.load('a'))
+        self.assertIsNone(cache.load('c'))
+        cache.clear()
+
+
+    def test_readonly(self):
+        """Other connections should read only committed values."""
+
+        cache = SQLiteCache(self.temp_path)
+        cache.save('a', 1)
+        cache.flush()
+        cache.save('b', 2)
+
+        reader = SQLiteCache(self.temp_path, readonly=True)
+        self.assertEqual(1, reader.load('a'))
+        self.assertIsNone(reader.load('b'))
+
+        reader.close()
+        cache.clear()
+
+    def test_readonly_clear(self):
+        """Readonly cache should not remove files of other cache."""
+
+        cache = SQLiteCache(self.temp_path)
+        cache.save('a', 1)
+        cache.flush()
+
+        reader = SQLiteCache(self.temp_path, readonly=True)
+        self.assertEqual(1, reader.load('a'))
+        reader.close()
+        reader.clear()
+
+        self.assertTrue(os.path.exists(cache.path))
+        self.assertEqual(1, cache.load('a'))
+        cache.clear()
+
+    def test_readonly_path(self):
+        """Readonly connection should open path with uri characters."""
+
+        path = os.path.join(self.temp_path, 'a?b#c%20 d')
+        cache = SQLiteCache(path)
+        cache.save('a', 1)
+        cache.flush()
+
+        reader = SQLiteCache(path, readonly=True)
+        self.assertEqual(1, reader.load('a'))
+
+        reader.close()
+        cache.clear()
+
+
+    def test_clear(self):
+        """Cache should remove files and can be used again after clearing."""
+
+        cache = SQLiteCache(self.temp_path)
+        cache.save('a', 1)
+        cache.clear()
+        self.assertFalse(os.listdir(self.temp_path))
+
+        self.assertIsNone(cache.load('a'))
+        cache.clear()
+
+
+
+class TestTieredCache(TestTemporaryDirectory):
+    """
+    Important!
+    This test creates temporary directory which is available as self.temp_path.
+    """
+
+    def test_memory(self):
+        """Values smaller than memory limit should not create disk cache."""
+
+        cache = TieredCache(self.temp_path, max_size=10)
+        cache.save('a', 'abc')
+        cache.save('b', 'abc')
+
+        self.assertEqual('abc', cache.load('a'))
+        self.assertIsNone(cache.load('c'))
+        self.assertEqual({'hits': 1, 'misses': 1, 'evictions': 0}, cache.stats)
+        self.assertFalse(os.listdir(self.temp_path))
+
+
+    def test_eviction(self):
+        """Least recently used values should be moved to disk cache."""
+
+        cache = TieredCache(self.temp_path, max_size=5)
+        cache.save('a', 'abc')
+        cache.save('b', 'abc')
+
+        self.assertEqual(1, cache.stats['evictions'])
+        self.assertNotIn('a', cache.memory)
+        self.assertEqual(3, cache.size)
+
+        # Value is loaded from disk and moved back to memory.
+        self.assertEqual('abc', cache.load('a'))
+        self.assertIn('a', cache.memory)
+        self.assertNotIn('b', cache.memory)
+
+        cache.remove('b')
+        self.assertIsNone(cache.load('b'))
+        cache.clear()
+        self.assertFalse(os.listdir(self.temp_path))
+
+
+    def test_nested_metadata(self):
+        """Items in metadata should be measured by their source."""
+
+        page = SiteItem('a.html', 'a.html')
+        for i in range(30):
+            nested = page
+            page = SiteItem('a.html', 'a.html')
+            page['pages'] = [nested, nested]
+
+        cache = TieredCache(self.temp_path, max_size=1024)
+        cache.save('a', ('abc', dict(page)))
+        self.assertLess(cache.size, 1024)
+        self.assertFalse(cache.stats['evictions'])
+
+    def test_metadata_size(self):
+        """Metadata should be measured with nested values."""
+
+        cache = TieredCache(self.temp_path, max_size=1024)
+        cache.save('a', ('abc', {'data': {'text': 'a' * 2000}}))
+        self.assertEqual(1, cache.stats['evictions'])
+        self.assertNotIn('a', cache.memory)
+        cache.clear()
+
+
+
+class TestRenderCache(TestTemporaryDirectory):
+    """
+    Important!
+    Site files are copied to temporary directory.
+    """
+
+    def setUp(self):
+        TestTemporaryDirectory.setUp(self)
+
+        self.path = os.path.join(self.temp_path, 'site')
+        copytree(os.path.join(os.path.dirname(__file__), 'data'), self.path)
+
+    def build(self):
+        site = Site(path=self.path, render_cache=True)
+        site.run()
+        return site
+
+    def test_cache(self):
+        """Site should use data rendered in previous build."""
+
+        site = self.build()
+        self.assertEqual({'hits': 0, 'misses': 3}, site.render_cache.stats)
+
+        site = self.build()
+        self.assertEqual({'hits': 3, 'misses': 0}, site.render_cache.stats)
+
+        with open(os.path.join(self.path, 'output', 'b', 'b.html')) as file:
+            self.assertEqual('<p>bb</p>', file.read())
+
+    def test_changed(self):
+        """Site should render again items which data was changed."""
+
+        self.build()
+        with open(os.path.join(self.path, 'a.html'), mode='w') as file:
+            file.write('new')
+
+        site = self.build()
+        self.assertEqual({'hits': 2, 'misses': 1}, site.render_cache.stats)
+
+    def test_partials(self):
+        """Site should not cache items using templates partials."""
+
+        with open(os.path.join(self.path, 'a.html'), mode='w') as file:
+            file.write('{{> b}}')
+
+        self.build()
+        site = self.build()
+        self.assertEqual({'hits': 2, 'misses': 0}, site.render_cache.stats)
+
+    def test_items_in_metadata(self):
+        """Key should include metadata of items in metadata, but not items
+        nested in them."""
+
+        cache = RenderCache(os.path.join(self.temp_path, 'render'))
+        site = Site(path=self.path)
+
+        page = SiteItem('b.html', 'b.html')
+        page.set_type(site.item_types('html'))
+        page['pages'] = []
+        for i in range(30):
+            nested = page
+            page = SiteItem('b.html', 'b.html')
+            page.set_type(site.item_types('html'))
+            page.update({'title': 'b', 'pages': [nested, nested]})
+
+        item = SiteItem('a.html', 'a.html')
+        item.set_type(site.item_types('html'))
+        item.data = 'a'
+        item['pages'] = [page]
+        key = cache.key(item)
+
+        page['title'] = 'c'
+        self.assertIsNotNone(key)
+        self.assertNotEqual(key, cache.key(item))
+
+    def test_disabled(self):
+        """Render cache should not be used if disabled in configuration."""
+
+        config.render_cache = False
+        try:
+            site = self.build()
+        finally:
+            config.render_cache = True
+
+        self.assertIsNone(site.render_cache)
+        self.assertFalse(os.path.exists(site.cache_path))
+
+    def test_prune(self):
+        """Render cache should remove least recently used files."""
+
+        cache = RenderCache(os.path.join(self.temp_path, 'render'), max_size=1)
+        cache.save('aa', 'a')
+        self.assertEqual(1, cache.prune())
+        self.assertIsNone(cache.load('aa'))
+
+
+
+class TestCompression(TestTemporaryDirectory):
+    """
+    Important!
+    This test creates temporary directory which is available as self.temp_path.
+    """
+
+    def test_threshold(self):
+        """Only values bigger than threshold should be compressed."""
+
+        for method in Compressor.methods:
+            compressor = Compressor(method, threshold=100)
+
+            small = compressor.compress({'a': 1})
+            big = compressor.compress('a' * 1000)
+
+            self.assertEqual({'a': 1}, compressor.decompress(small))
+            self.assertEqual('a' * 1000, compressor.decompress(big))
+            self.assertEqual(1, compressor.stats['compressed'])
+            self.assertGreater(compressor.ratio, 1)
+
+
+    def test_cache(self):
+        """Cache classes should store compressed values."""
+
+        for cache_class in (ShelveCache, SQLiteCache):
+            cache = cache_class(self.temp_path, compression='zlib', threshold=10)
+            cache.save('a', 'a' * 1000)
+            cache.flush()
+
+            self.assertEqual('a' * 1000, cache.load('a'))
+            self.assertEqual(1, cache.stats['compressed'])
+            self.assertGreater(cache.stats['ratio'], 10)
+            cache.clear()
@@ -0,0 +1,38 @@
+import unittest
+from stado.core.dependencies import DependencyGraph
+
+
+class TestDependencyGraph(unittest.TestCase):
+
+    def test_building(self):
+        """Graph should add dependencies to currently built item."""
+
+        graph = DependencyGraph()
+        graph.add_item('a.html')
+
+        with graph.building('b.html'):
+            graph.add_item('a.html')
+            graph.add_file('layout.html')
+            with graph.building('c.html'):
+                graph.add_query('*.md')
+
+        self.assertEqual({'items': ['a.html'], 'files': ['layout.html'],
+                          'queries': []}, graph.get('b.html'))
+        self.assertEqual(['*.md'], graph.get('c.html')['queries'])
+        self.assertEqual([], graph.get('a.html')['items'])
+
+
+    def test_dependents(self):
+        """Graph should return items using item, file or query."""
+
+        graph = DependencyGraph()
+
+        with graph.building('a.html'):
+            graph.add_item('b.html')
+        with graph.building('c.html'):
+            graph.add_query('*.html')
+        with graph.building('d.html'):
+            graph.add_file('layout.mustache')
+
+        self.assertEqual(['a.html', 'c.html'], graph.dependents('b.html'))
+        self.assertEqual(['d.html'], graph.dependents('layout.mustache'))
@@ -49,3 +49,16 @@ class TestEvents(unittest.TestCase):
         a.events.subscribe(b)
         for returned in a.event('hello'):
             self.assertEqual(returned, 'hello world')
+
+
+    def test_dispatch_table(self):
+        """Event handler should run methods bound after previous event."""
+
+        a = A()
+        b = B()
+        a.events.subscribe(b)
+
+        self.assertEqual([], a.event('bye'))
+        b.events.bind({'bye': lambda: 'bye'})
+        self.assertEqual(['bye'], a.event('bye'))
+        self.assertTrue(a.events.has('bye'))
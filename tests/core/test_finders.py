@@ -1,6 +1,8 @@
 import os
+import shutil
+import tempfile
 
-from stado.core.finders import FileSystemItemFinder
+from stado.core.finders import FileSystemItemFinder, ParallelFileSystemItemFinder
 from tests import TestInCurrentDirectory
 
 
@@ -35,3 +37,62 @@ class TestFileSystemContentFinder(TestInCurrentDirectory):
         files = [i for i in finder.search('data', excluded_paths=['a.html'])]
 
         self.assertEqual(3, len(files))
+
+
+    def test_scan(self):
+        """Finder should yield sorted paths with stat results."""
+
+        finder = FileSystemItemFinder()
+        files = [i for i in finder.scan('data')]
+
+        self.assertEqual([os.path.join('data', 'a.html'),
+                          os.path.join('data', 'b.html'),
+                          os.path.join('data', 'image.jpg'),
+                          os.path.join('data', 'b', 'b.md')],
+                         [path for path, stat in files])
+        for path, stat in files:
+            self.assertEqual(os.stat(path).st_size, stat.st_size)
+
+
+    def test_search_excluded_siblings(self):
+        """Finder should skip each excluded folder, also next to other ones."""
+
+        os.makedirs(os.path.join('data', 'c'))
+        try:
+            with open(os.path.join('data', 'c', 'c.html'), 'w') as file:
+                file.write('c')
+
+            finder = FileSystemItemFinder()
+            files = [i for i in finder.search('data', excluded_paths=['b', 'c'])]
+            self.assertEqual(3, len(files))
+        finally:
+            os.remove(os.path.join('data', 'c', 'c.html'))
+            os.rmdir(os.path.join('data', 'c'))
+
+
+
+    def test_scan_errors(self):
+        """Finder should skip missing directories and yield broken links
+        without stat."""
+
+        path = tempfile.mkdtemp()
+        try:
+            os.symlink(os.path.join(path, 'missing'), os.path.join(path, 'a.html'))
+
+            finder = FileSystemItemFinder()
+            self.assertEqual([(os.path.join(path, 'a.html'), None)],
+                             list(finder.scan(path)))
+            self.assertEqual([], list(finder.scan(os.path.join(path, 'missing'))))
+        finally:
+            shutil.rmtree(path)
+
+
+    def test_parallel_scan(self):
+        """Parallel finder should yield paths in the same order."""
+
+        finder = ParallelFileSystemItemFinder(workers=2)
+        files = [i for i in finder.search('data', excluded_paths=['a.html'])]
+
+        self.assertEqual([i for i in FileSystemItemFinder().search(
+            'data', excluded_paths=['a.html'])], files)
+        self.assertEqual(3, len(files))
@@ -1,5 +1,6 @@
 import unittest
-from stado.core.item import SiteItem
+from stado.core.item import SiteItem, CompactItem
+from stado.templates.mustache import Mustache
 
 
 class TestItem(unittest.TestCase):
@@ -15,3 +16,48 @@ class TestItem(unittest.TestCase):
 
         item = SiteItem('a\\b\\c', '')
         self.assertEqual('a/b/c', item.source)
+
+
+class TestCompactItem(unittest.TestCase):
+
+    def test_metadata(self):
+        """CompactItem should store metadata like SiteItem."""
+
+        item = CompactItem('a/b/c', '')
+        self.assertEqual({}, item.dump())
+
+        item.metadata.update({'title': 'hello'})
+        item['b'] = 1
+        self.assertEqual({'title': 'hello', 'b': 1}, item.dump())
+        self.assertEqual('hello', item.title)
+        self.assertIn('b', item)
+
+        item.metadata = None
+        self.assertEqual(0, len(item))
+        self.assertIsNone(item._metadata)
+
+    def test_slots(self):
+        """CompactItem should not have __dict__."""
+
+        item = CompactItem('a/b/c', '')
+        self.assertFalse(hasattr(item, '__dict__'))
+        with self.assertRaises(AttributeError):
+            item.other = 1
+
+    def test_template_metadata(self):
+        """Templates should read CompactItem metadata before its attributes."""
+
+        item = CompactItem('a/b/c', '')
+        item.type = 'html'
+        item.update({'type': 'post', 'items': 'a'})
+
+        template = '{{page.type}} {{#page.items}}{{.}}{{/page.items}}'
+        self.assertEqual('post a', Mustache('').render(template, {'page': item}))
+
+    def test_events(self):
+        """CompactItem should create events handler only when it is used."""
+
+        item = CompactItem('a/b/c', '')
+        self.assertIsNone(item._events)
+        self.assertFalse(item.has_renderer_events())
+        self.assertIsNotNone(item._events)
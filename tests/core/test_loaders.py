@@ -1,7 +1,8 @@
 import os
+import tempfile
 
 from stado.core.loaders import FileSystemItemLoader
-from stado.core.loaders import FileItem
+from stado.core.loaders import FileItem, CompactFileItem
 from tests import TestInCurrentDirectory
 
 
@@ -59,3 +60,42 @@ class TestFileSystemContentLoader(TestInCurrentDirectory):
 
         data = [i.data for i in contents if i.source.endswith('.html')]
         self.assertCountEqual(['a', 'b'], data)
+
+
+    def test_item_class(self):
+
+        loader = FileSystemItemLoader(item_class=CompactFileItem)
+        contents = [i for i in loader.load('data')]
+
+        self.assertIsInstance(contents[0], CompactFileItem)
+        data = [i.data for i in contents if i.source.endswith('.html')]
+        self.assertCountEqual(['a', 'b'], data)
+
+
+    def test_binary_data(self):
+        """Binary items should be read as bytes, large ones as memoryview."""
+
+        data = bytes(range(256))
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(data)
+        self.addCleanup(os.remove, file.name)
+
+        item = FileItem(file.name, 'image.jpg')
+        item.binary = True
+
+        item.mmap_threshold = 0
+        self.assertEqual(data, bytes(item.data))
+        self.assertIsInstance(item.data, memoryview)
+        self.assertFalse(item.has_data())
+
+        item.mmap_threshold = len(data)
+        self.assertEqual(data, item.data)
+        self.assertTrue(item.has_data())
+
+
+    def test_data_read_once(self):
+
+        item = FileItem(os.path.join('data', 'a.html'), 'a.html')
+        self.assertFalse(item.has_data())
+        self.assertEqual('a', item.data)
+        self.assertTrue(item.has_data())
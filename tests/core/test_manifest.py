@@ -0,0 +1,165 @@
+import os
+import tempfile
+import shutil
+
+from stado.core.site import Site
+from stado.utils import copytree
+from tests import TestTemporaryDirectory
+
+
+class TestIncrementalBuild(TestTemporaryDirectory):
+    """
+    Important!
+    Site files are copied to temporary directory, site is build in
+    self.output directory.
+    """
+
+    def setUp(self):
+        TestTemporaryDirectory.setUp(self)
+
+        copytree(os.path.join(os.path.dirname(__file__), 'data'), self.temp_path)
+        self.output = tempfile.mkdtemp()
+
+    def tearDown(self):
+        TestTemporaryDirectory.tearDown(self)
+        shutil.rmtree(self.output)
+
+    def build(self, setup=None):
+        """Builds site, optional setup function can use controllers."""
+
+        site = Site(path=self.temp_path, output=self.output, incremental=True)
+        if setup:
+            setup(site)
+        site.run()
+        return site
+
+    def read(self, path):
+        with open(os.path.join(self.output, path)) as file:
+            return file.read()
+
+    def write(self, path, data):
+        with open(path, mode='w') as file:
+            file.write(data)
+
+
+    def test_unchanged(self):
+        """Incremental build should skip items which were not changed."""
+
+        self.build()
+        self.write(os.path.join(self.output, 'a.html'), 'old')
+        self.build()
+
+        self.assertEqual('old', self.read('a.html'))
+
+    def test_changed(self):
+        """Incremental build should render items which source was changed."""
+
+        self.build()
+        self.write(os.path.join(self.output, 'a.html'), 'old')
+        self.write(os.path.join(self.output, 'b.html'), 'old')
+        self.write(os.path.join(self.temp_path, 'a.html'), 'new')
+        self.build()
+
+        self.assertEqual('new', self.read('a.html'))
+        self.assertEqual('old', self.read('b.html'))
+
+    def test_missing_output(self):
+        """Incremental build should deploy items which output was removed."""
+
+        self.build()
+        os.remove(os.path.join(self.output, 'a.html'))
+        self.build()
+
+        self.assertEqual('a', self.read('a.html'))
+
+    def test_deleted(self):
+        """Incremental build should remove output of deleted items."""
+
+        self.build()
+        os.remove(os.path.join(self.temp_path, 'a.html'))
+        self.build()
+
+        self.assertFalse(os.path.exists(os.path.join(self.output, 'a.html')))
+        self.assertTrue(os.path.exists(os.path.join(self.output, 'b.html')))
+
+    def test_dependency_changed(self):
+        """Incremental build should render items which read changed item."""
+
+        def setup(site):
+            @site.before('a.html')
+            def pages():
+                return {'pages': [i.source for i in site.pages('b.html')]}
+
+        self.build(setup)
+        self.write(os.path.join(self.output, 'a.html'), 'old')
+        self.write(os.path.join(self.output, 'image.jpg'), 'old')
+        self.write(os.path.join(self.temp_path, 'b.html'), 'new')
+        self.build(setup)
+
+        self.assertEqual('a', self.read('a.html'))
+        self.assertEqual('old', self.read('image.jpg'))
+
+    def test_relative_paths(self):
+        """Manifest should not contain absolute paths to site files."""
+
+        site = self.build()
+        with open(site.manifest.path) as file:
+            self.assertNotIn(self.temp_path, file.read())
+        self.assertIn('a.html', site.manifest.files)
+
+        # Site moved to other location is not built again.
+        path = tempfile.mkdtemp()
+        try:
+            copytree(self.temp_path, path)
+            self.write(os.path.join(self.output, 'a.html'), 'old')
+
+            Site(path=path, output=self.output, incremental=True).run()
+            self.assertEqual('old', self.read('a.html'))
+        finally:
+            shutil.rmtree(path)
+
+    def test_items_in_metadata(self):
+        """Items in metadata should not change item fingerprint."""
+
+        def setup(site):
+            @site.before('a.html')
+            def pages():
+                return {'pages': list(site.pages('b.html'))}
+
+        self.build(setup)
+        self.write(os.path.join(self.output, 'a.html'), 'old')
+        self.build(setup)
+
+        self.assertEqual('old', self.read('a.html'))
+
+    def test_not_serializable_metadata(self):
+        """Incremental build should render items with metadata which can not
+        be hashed."""
+
+        def setup(site):
+            @site.before('a.html')
+            def function():
+                return {'function': lambda: None}
+
+        self.build(setup)
+        self.write(os.path.join(self.output, 'a.html'), 'old')
+        self.build(setup)
+
+        self.assertEqual('a', self.read('a.html'))
+
+    def test_file_dependency_changed(self):
+        """Incremental build should render items which read changed file."""
+
+        self.write(os.path.join(self.temp_path, 'include.html'), 'old')
+
+        def setup(site):
+            @site.after('a.html')
+            def include():
+                return site.render_file('include.html')
+
+        self.build(setup)
+        self.assertEqual('old', self.read('a.html'))
+
+        self.write(os.path.join(self.temp_path, 'include.html'), 'new')
+        self.build(setup)
+        self.assertEqual('new', self.read('a.html'))
@@ -1,5 +1,5 @@
 import unittest
-from stado.core.pathmatch import pathmatch
+from stado.core.pathmatch import pathmatch, PathMatcher, MatchIndex
 
 
 class TestPathMatch(unittest.TestCase):
@@ -61,3 +61,52 @@ class TestPathMatch(unittest.TestCase):
         self.assertTrue(pathmatch('b.html', '**b.html'))
         self.assertTrue(pathmatch('bb.html', '**b.html'))
         self.assertTrue(pathmatch('a/a/ab.html', '**b.html'))
+
+
+class TestPathMatcher(unittest.TestCase):
+
+    def test_match(self):
+
+        matcher = PathMatcher(['*.html', 'b\\*.md'])
+
+        self.assertTrue(matcher.match('a.html'))
+        self.assertTrue(matcher.match('b\\a.md'))
+        self.assertFalse(matcher.match('b/a.html'))
+        self.assertFalse(PathMatcher([]).match('a.html'))
+
+    def test_indices(self):
+
+        matcher = PathMatcher(['b/*', '*.html', '**.html'])
+
+        self.assertEqual(0, matcher.first('b/a.html'))
+        self.assertEqual([0, 2], matcher.indices('b/a.html'))
+        self.assertEqual([1, 2], matcher.indices('a.html'))
+        self.assertEqual([], matcher.indices('a.md'))
+        self.assertEqual([1, 2], matcher.indices('a.html'))
+        self.assertEqual([], PathMatcher([]).indices('a.html'))
+        self.assertIsNone(matcher.first('a.md'))
+
+
+class TestMatchIndex(unittest.TestCase):
+
+    def test_get(self):
+
+        index = MatchIndex()
+        index.add(['*.html'], 'a')
+        index.add(['b/*', 'c/*'], 'b')
+        index.add(['**.html'], 'c')
+
+        self.assertEqual(['a', 'c'], index.get('a.html'))
+        self.assertEqual(['b', 'c'], index.get('b/a.html'))
+        self.assertEqual([], index.get('a.md'))
+
+    def test_changed(self):
+        """Index should match paths again after registration."""
+
+        index = MatchIndex()
+        index.add(['*.html'], 'a')
+        self.assertEqual(['a'], index.get('a.html'))
+
+        index.set(['*.html'], 'b')
+        index.add(['a.*'], 'c')
+        self.assertEqual(['b', 'c'], index.get('a.html'))
@@ -1,6 +1,12 @@
 import os
 
 from stado.core.site import Site
+from stado.core.cache import ShelveCache, SQLiteCache
+from stado.core.loaders import FileSystemItemLoader, CompactFileItem
+from stado.errors import DeployError
+from stado import config
+from stado.libs.markdown.extensions.toc import TocExtension
+from stado.plugins.extensions.markdown import MarkdownRenderer
 from tests import TestTemporaryDirectory
 
 
@@ -21,3 +27,224 @@ class TestSite(TestTemporaryDirectory):
         self.assertTrue(os.path.exists(os.path.join(self.temp_path, 'a.html')))
         self.assertTrue(os.path.exists(os.path.join(self.temp_path, 'image.jpg')))
         self.assertTrue(os.path.exists(os.path.join(self.temp_path, 'b', 'b.html')))
+
+
+    def test_run_shelve_cache(self):
+        """Site should build items stored in shelve cache."""
+
+        path = os.path.dirname(__file__)
+
+        site = Site(path=os.path.join(path, 'data'), output=self.temp_path,
+                    cache=ShelveCache)
+        site.run()
+
+        with open(os.path.join(self.temp_path, 'b', 'b.html')) as file:
+            self.assertEqual('<p>bb</p>', file.read())
+        self.assertFalse(os.path.exists(os.path.join(self.temp_path, '__cache__')))
+
+
+    def test_run_sqlite_cache(self):
+        """Site should build items stored in SQLite cache."""
+
+        path = os.path.dirname(__file__)
+
+        site = Site(path=os.path.join(path, 'data'), output=self.temp_path,
+                    cache=SQLiteCache)
+        site.run()
+
+        with open(os.path.join(self.temp_path, 'b', 'b.html')) as file:
+            self.assertEqual('<p>bb</p>', file.read())
+        self.assertFalse(os.path.exists(os.path.join(self.temp_path, '__cache__')))
+
+
+    def test_run_compact_items(self):
+        """Site should build items using less memory."""
+
+        path = os.path.dirname(__file__)
+
+        site = Site(path=os.path.join(path, 'data'), output=self.temp_path,
+                    loaders=[FileSystemItemLoader(item_class=CompactFileItem)])
+
+        @site.before('b/b.md')
+        def page(item):
+            return {'title': item.source}
+
+        @site.after('b/b.md')
+        def page(data, item):
+            return item['title'] + data
+
+        site.run()
+
+        with open(os.path.join(self.temp_path, 'b', 'b.html')) as file:
+            self.assertEqual('b/b.md<p>bb</p>', file.read())
+        self.assertTrue(os.path.exists(os.path.join(self.temp_path, 'image.jpg')))
+
+
+    def test_run_render_workers(self):
+        """Site should render items using pool of processes."""
+
+        path = os.path.dirname(__file__)
+
+        site = Site(path=os.path.join(path, 'data'), output=self.temp_path,
+                    render_workers=2)
+
+        @site.after('b/b.md')
+        def page(data, item):
+            return item.source + data
+
+        site.run()
+
+        with open(os.path.join(self.temp_path, 'a.html')) as file:
+            self.assertEqual('a', file.read())
+        with open(os.path.join(self.temp_path, 'b', 'b.html')) as file:
+            self.assertEqual('b/b.md<p>bb</p>', file.read())
+        self.assertTrue(os.path.exists(os.path.join(self.temp_path, 'image.jpg')))
+
+
+    def test_render_workers_reload(self):
+        """Items loaded from cache by after rendering events should keep their
+        rendered data when using pool of processes."""
+
+        path = os.path.join(os.path.dirname(__file__), 'data')
+        site = Site(path=path, output=self.temp_path, render_workers=2)
+
+        # Items with helpers are rendered in this process.
+        @site.helper
+        def title():
+            return 'title'
+
+        @site.after('*')
+        def pages(data):
+            list(site.pages())
+            return data
+
+        site.run()
+
+        with open(os.path.join(self.temp_path, 'b', 'b.html')) as file:
+            self.assertEqual('<p>bb</p>', file.read())
+
+    def test_render_workers_binary(self):
+        """Binary items without renderers should not be send to workers."""
+
+        path = os.path.join(self.temp_path, 'site')
+        output = os.path.join(self.temp_path, 'output')
+        os.makedirs(path)
+        with open(os.path.join(path, 'a.html'), mode='w') as file:
+            file.write('a')
+        with open(os.path.join(path, 'image.jpg'), mode='wb') as file:
+            file.write(b'\xff\xd8\xff\x00\x80')
+
+        Site(path=path, output=output, render_workers=2).run()
+
+        with open(os.path.join(output, 'image.jpg'), mode='rb') as file:
+            self.assertEqual(b'\xff\xd8\xff\x00\x80', file.read())
+        with open(os.path.join(output, 'a.html')) as file:
+            self.assertEqual('a', file.read())
+
+    def test_run_deploy_workers(self):
+        """Site should write items using pool of threads and report failed
+        items after writing other items."""
+
+        path = os.path.dirname(__file__)
+
+        site = Site(path=os.path.join(path, 'data'), output=self.temp_path,
+                    deploy_workers=2)
+
+        # Output path is pointing to directory, so writing fails.
+        site.permalink('a.html', '/b')
+
+        with self.assertRaises(DeployError) as error:
+            site.run()
+        self.assertEqual(['a.html'], [i for i, e in error.exception.failures])
+
+        self.assertTrue(os.path.exists(os.path.join(self.temp_path, 'image.jpg')))
+        with open(os.path.join(self.temp_path, 'b', 'b.html')) as file:
+            self.assertEqual('<p>bb</p>', file.read())
+
+
+    def test_stats(self):
+        """Site should store statistics of last build."""
+
+        path = os.path.dirname(__file__)
+
+        site = Site(path=os.path.join(path, 'data'), output=self.temp_path)
+        site.run()
+
+        self.assertEqual(['load', 'render', 'deploy'], list(site.stats.phases))
+        self.assertEqual(2, site.stats.types['html'])
+        self.assertEqual(1, site.stats.types['md'])
+        self.assertEqual(0, site.stats.cache['misses'])
+        self.assertTrue(site.stats.cache['hits'])
+        # Rendered data: 'a', 'b' and '<p>bb</p>'.
+        self.assertEqual(11, site.stats.cache['bytes_written'])
+        self.assertEqual(11, site.stats.cache['bytes_read'])
+
+        markdown = 'stado.plugins.extensions.markdown.MarkdownRenderer'
+        self.assertEqual(['b/b.md'],
+                         [i for t, i in site.stats.slowest_items(markdown)])
+
+
+    def test_copy_mode(self):
+        """Site should copy or link files and keep their modification time."""
+
+        path = os.path.join(os.path.dirname(__file__), 'data')
+        source = os.path.join(path, 'image.jpg')
+        output = os.path.join(self.temp_path, 'image.jpg')
+
+        Site(path=path, output=self.temp_path).run()
+        self.assertEqual(os.stat(source).st_mtime_ns,
+                         os.stat(output).st_mtime_ns)
+        self.assertFalse(os.path.samefile(source, output))
+
+        os.remove(output)
+        Site(path=path, output=self.temp_path, copy_mode='hardlink').run()
+        self.assertTrue(os.path.samefile(source, output))
+
+        # Global option overrides site option.
+        config.copy_mode = 'copy'
+        try:
+            os.remove(output)
+            Site(path=path, output=self.temp_path, copy_mode='hardlink').run()
+        finally:
+            config.copy_mode = None
+        self.assertFalse(os.path.samefile(source, output))
+
+
+    def test_skip_unchanged(self):
+        """Site should not write output files which have the same content."""
+
+        path = os.path.join(os.path.dirname(__file__), 'data')
+        output = os.path.join(self.temp_path, 'a.html')
+
+        Site(path=path, output=self.temp_path).run()
+        os.utime(output, (0, 0))
+
+        site = Site(path=path, output=self.temp_path)
+        site.run()
+
+        self.assertEqual(0, os.stat(output).st_mtime)
+        self.assertEqual({'written': 0, 'skipped': 4}, site.stats.deployed)
+
+
+    def test_markdown_extensions(self):
+        """Site should render markdown using extensions from site config."""
+
+        path = os.path.join(os.path.dirname(__file__), 'data')
+        site = Site(path=path, output=self.temp_path,
+                    config={'markdown_extensions': ['nl2br']})
+
+        renderer = site.item_types('md')['renderers'][-1]
+        self.assertEqual(['nl2br'], renderer.extensions)
+        self.assertEqual('<p>a<br />\nb</p>', renderer('a\nb', {}))
+        self.assertEqual('<p>c</p>', renderer('c', {}))
+
+    def test_markdown_extensions_key(self):
+        """Markdown extensions objects should have the same key in each
+        process."""
+
+        key = MarkdownRenderer(['nl2br', TocExtension([('title', 'a')])]).cache_key
+        self.assertEqual(key, MarkdownRenderer(
+            ['nl2br', TocExtension([('title', 'a')])]).cache_key)
+        self.assertNotEqual(key, MarkdownRenderer(
+            ['nl2br', TocExtension([('title', 'b')])]).cache_key)
+        self.assertNotIn(' at 0x', key)
@@ -1,6 +1,8 @@
 """Testing support for jinja2."""
 
 import os
+import shutil
+import tempfile
 import unittest
 from stado import templates
 from tests import TestInCurrentDirectory
@@ -41,3 +43,22 @@ class TestJinja2Template(TestInCurrentDirectory):
         result = engine.render('{% extends "a.html" %}{% block b %}'
                                'hello world{% endblock %}', {})
         self.assertEqual(result, 'hello world')
+
+
+    def test_render_file(self):
+        """should compile template file once and store its bytecode"""
+
+        from stado import config
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        with open(os.path.join(path, 'layout.html'), 'w') as file:
+            file.write('{{ a }}!')
+
+        engine = templates.load('jinja2')(path)
+        layout = os.path.join(path, 'layout.html')
+
+        self.assertEqual('1!', engine.render_file(layout, {'a': 1}))
+        self.assertEqual('2!', engine.render_file(layout, {'a': 2}))
+        self.assertEqual(1, len(engine.templates))
+        self.assertTrue(os.listdir(os.path.join(path, config.cache_dir, 'jinja2')))
@@ -17,3 +17,76 @@ class TestMustacheTemplate(unittest.TestCase):
 
         result = engine.render('{{ hello }}', {'hello': 'hello world'})
         self.assertEqual(result, 'hello world')
+
+
+    def test_parsed_templates_cache(self):
+        """should parse the same template once"""
+
+        engine = templates.load('mustache')()
+        engine.reset_stats()
+
+        for i in range(3):
+            result = engine.render('{{ a }} {{ b }}!', {'a': i, 'b': 'x'})
+            self.assertEqual('{} x!'.format(i), result)
+
+        stats = engine.stats()
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(2, stats['hits'])
+
+
+    def test_helpers(self):
+        """should call helpers functions only when template uses them"""
+
+        engine = templates.load('mustache')()
+        called = []
+
+        def used():
+            called.append('used')
+            return 'hello'
+
+        def unused():
+            called.append('unused')
+
+        result = engine.render('{{ used }}', {'used': used, 'unused': unused})
+        self.assertEqual('hello', result)
+        self.assertEqual(['used'], called)
+
+
+    def test_compiled(self):
+        """should render the same output using compiled templates"""
+
+        from stado.templates.mustache import CompiledRenderer
+        from stado.libs import pystache
+
+        partials = {'item': '  <li>{{name}}</li>\n'}
+        context = {
+            'title': 'A & B',
+            'html': '<b>bold</b>',
+            'items': [{'name': 'a'}, {'name': 'b <c>'}],
+            'empty': [],
+            'page': {'meta': {'author': 'badger'}},
+            'number': 0,
+            'wrap': lambda text: '<div>' + text + '</div>',
+            'helper': lambda: 'helped',
+        }
+        sources = [
+            'Hello {{title}} {{{html}}} {{& html}}!',
+            '{{#items}}\n  {{name}}\n{{/items}}\n',
+            '{{^empty}}nothing{{/empty}}{{^items}}never{{/items}}',
+            '{{page.meta.author}} {{missing}} {{number}}',
+            '{{#page}}{{#meta}}{{author}} {{title}}{{/meta}}{{/page}}',
+            '{{! comment }}\n{{=<% %>=}}\n<% title %> <%#items%><%name%><%/items%>',
+            '{{#wrap}}{{title}}{{/wrap}} {{helper}}',
+            '<ul>\n  {{#items}}\n  {{>item}}\n  {{/items}}\n</ul>',
+            '{{#number}}zero{{/number}}{{#empty}}{{/empty}}',
+        ]
+
+        for source in sources:
+            expected = pystache.Renderer(partials=partials).render(source, context)
+            result = CompiledRenderer(partials=partials).render(source, context)
+            self.assertEqual(expected, result)
+
+        engine = templates.load('mustache')()
+        engine.compiled = True
+        self.assertEqual('hello world',
+                         engine.render('{{ hello }}', {'hello': lambda: 'hello world'}))